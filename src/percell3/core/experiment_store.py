@@ -31,6 +31,7 @@ def _validate_name(value: str, field: str = "name") -> str:
 import dask.array as da
 import numpy as np
 import pandas as pd
+import zarr
 
 from percell3.core import queries, zarr_io
 from percell3.core.exceptions import (
@@ -55,7 +56,7 @@ from percell3.core.models import (
     SegmentationInfo,
     ThresholdInfo,
 )
-from percell3.core.schema import create_schema, open_database
+from percell3.core.schema import close_database, create_schema, open_database
 
 
 class ExperimentStore:
@@ -72,6 +73,10 @@ class ExperimentStore:
     def __init__(self, path: Path, conn: sqlite3.Connection) -> None:
         self._path = path
         self._conn = conn
+        self._zarr_roots: dict[str, zarr.Group] = {}
+        # name -> ChannelConfig in display order; None until first lookup.
+        # Invalidated by add_channel / rename_channel.
+        self._channel_cache: dict[str, ChannelConfig] | None = None
 
     # --- Lifecycle ---
 
@@ -135,10 +140,22 @@ class ExperimentStore:
         conn = open_database(db_path)
         return cls(path, conn)
 
+    @classmethod
+    def _open_unchecked(cls, path: Path) -> ExperimentStore:
+        """Open an experiment this process just created, skipping validation.
+
+        Bypasses the schema version check and missing-table repair done by
+        :meth:`open`. Callers must guarantee the database was written by the
+        current schema; production code should always use :meth:`open`.
+        """
+        path = Path(path)
+        conn = open_database(path / "experiment.db", validate=False)
+        return cls(path, conn)
+
     def close(self) -> None:
         """Close database connections."""
         if self._conn:
-            self._conn.close()
+            close_database(self._conn)
             self._conn = None  # type: ignore[assignment]
 
     def __enter__(self) -> ExperimentStore:
@@ -150,6 +167,21 @@ class ExperimentStore:
     def __repr__(self) -> str:
         return f"ExperimentStore({self._path!r})"
 
+    def _zarr_root(self, zarr_path: Path) -> Path | zarr.Group:
+        """Return a cached open root group for one of the experiment's stores.
+
+        Falls back to the bare path (opened per call by zarr_io) when the
+        store directory does not exist yet.
+        """
+        key = zarr_path.name
+        root = self._zarr_roots.get(key)
+        if root is None:
+            if not zarr_path.exists():
+                return zarr_path
+            root = zarr_io.open_store_root(zarr_path)
+            self._zarr_roots[key] = root
+        return root
+
     # --- Properties ---
 
     @property
@@ -188,17 +220,31 @@ class ExperimentStore:
         is_segmentation: bool = False,
     ) -> int:
         _validate_name(name, "channel name")
+        self._channel_cache = None
         return queries.insert_channel(
             self._conn, name, role=role, color=color,
             excitation_nm=excitation_nm, emission_nm=emission_nm,
             is_segmentation=is_segmentation,
         )
 
+    def _channels_by_name(self) -> dict[str, ChannelConfig]:
+        """Return the memoized name -> ChannelConfig map, loading it if needed."""
+        if self._channel_cache is None:
+            self._channel_cache = {
+                ch.name: ch for ch in queries.select_channels(self._conn)
+            }
+        return self._channel_cache
+
     def get_channels(self) -> list[ChannelConfig]:
-        return queries.select_channels(self._conn)
+        return list(self._channels_by_name().values())
 
     def get_channel(self, name: str) -> ChannelConfig:
-        return queries.select_channel_by_name(self._conn, name)
+        ch = self._channels_by_name().get(name)
+        if ch is None:
+            # Miss may mean another connection added it; re-check the database
+            self._channel_cache = None
+            ch = queries.select_channel_by_name(self._conn, name)
+        return ch
 
     # --- Biological Replicate Management ---
 
@@ -279,6 +325,61 @@ class ExperimentStore:
 
         return fov_id
 
+    def add_fovs(
+        self, specs: list[tuple[str, str, int | None, int | None]],
+    ) -> list[int]:
+        """Add several FOVs to the default bio rep.
+
+        Bulk counterpart of :meth:`add_fov`. The FOV rows are inserted in
+        one transaction, so a duplicate name adds none of them. Whole-field
+        segmentations (one per distinct ``(width, height)``), config entries
+        and the status cache are then written in their own commits, as in
+        :meth:`add_fov`; a failure there leaves the new FOVs in place
+        without config entries. FOVs without a size get no whole-field
+        segmentation.
+
+        Args:
+            specs: ``(display_name, condition, width, height)`` tuples.
+
+        Returns:
+            The new FOV IDs, in the same order as *specs*.
+        """
+        if not specs:
+            return []
+
+        try:
+            br_row = queries.select_bio_rep_by_name(self._conn, "N1")
+            bio_rep_id = br_row["id"]
+        except BioRepNotFoundError:
+            bio_rep_id = queries.insert_bio_rep(self._conn, "N1")
+
+        cond_ids: dict[str, int] = {}
+        rows: list[tuple[str, int, int, int | None, int | None]] = []
+        for display_name, condition, width, height in specs:
+            _validate_name(display_name, "fov display_name")
+            if condition not in cond_ids:
+                cond_ids[condition] = queries.select_condition_id(self._conn, condition)
+            rows.append((display_name, cond_ids[condition], bio_rep_id, width, height))
+
+        fov_ids = queries.insert_fovs(self._conn, rows)
+
+        # Auto-create whole-field segmentations (one per distinct size)
+        config = self.get_or_create_analysis_config()
+        seg_by_dims: dict[tuple[int, int], int] = {}
+        for fov_id, (_, _, width, height) in zip(fov_ids, specs):
+            if width is None or height is None:
+                continue
+            if (width, height) not in seg_by_dims:
+                seg_by_dims[(width, height)] = self._get_or_create_whole_field_segmentation(
+                    fov_id, width, height,
+                )
+            queries.insert_fov_config_entry(
+                self._conn, config.id, fov_id, seg_by_dims[(width, height)],
+            )
+
+        self.update_fov_status_cache_batch(fov_ids)
+        return fov_ids
+
     def get_conditions(self) -> list[str]:
         return queries.select_conditions(self._conn)
 
@@ -347,6 +448,7 @@ class ExperimentStore:
     def rename_channel(self, old_name: str, new_name: str) -> None:
         """Rename a channel. Updates SQLite and NGFF metadata."""
         _validate_name(new_name, "channel name")
+        self._channel_cache = None
         queries.rename_channel(self._conn, old_name, new_name)
         zarr_io.rename_channel_in_ngff(self.images_zarr_path, old_name, new_name)
 
@@ -384,7 +486,7 @@ class ExperimentStore:
         channels = self.get_channels()
 
         zarr_io.write_image_channel(
-            self.images_zarr_path,
+            self._zarr_root(self.images_zarr_path),
             gp,
             channel_index=ch.display_order,
             num_channels=len(channels),
@@ -396,13 +498,15 @@ class ExperimentStore:
     def read_image(self, fov_id: int, channel: str) -> da.Array:
         gp = zarr_io.image_group_path(fov_id)
         ch = self.get_channel(channel)
-        return zarr_io.read_image_channel(self.images_zarr_path, gp, ch.display_order)
+        return zarr_io.read_image_channel(
+            self._zarr_root(self.images_zarr_path), gp, ch.display_order,
+        )
 
     def read_image_numpy(self, fov_id: int, channel: str) -> np.ndarray:
         gp = zarr_io.image_group_path(fov_id)
         ch = self.get_channel(channel)
         return zarr_io.read_image_channel_numpy(
-            self.images_zarr_path, gp, ch.display_order
+            self._zarr_root(self.images_zarr_path), gp, ch.display_order
         )
 
     # --- Auto-naming helpers ---
@@ -566,12 +670,12 @@ class ExperimentStore:
         Labels are stored at ``labels.zarr/seg_{segmentation_id}/0``.
         """
         gp = zarr_io.label_group_path(segmentation_id)
-        zarr_io.write_labels(self.labels_zarr_path, gp, labels)
+        zarr_io.write_labels(self._zarr_root(self.labels_zarr_path), gp, labels)
 
     def read_labels(self, segmentation_id: int) -> np.ndarray:
         """Read a label image from labels.zarr."""
         gp = zarr_io.label_group_path(segmentation_id)
-        return zarr_io.read_labels(self.labels_zarr_path, gp)
+        return zarr_io.read_labels(self._zarr_root(self.labels_zarr_path), gp)
 
     # --- Cell Records ---
 
@@ -798,12 +902,12 @@ class ExperimentStore:
         Masks are stored at ``masks.zarr/thresh_{threshold_id}/mask/0``.
         """
         gp = zarr_io.mask_group_path(threshold_id)
-        zarr_io.write_mask(self.masks_zarr_path, gp, mask)
+        zarr_io.write_mask(self._zarr_root(self.masks_zarr_path), gp, mask)
 
     def read_mask(self, threshold_id: int) -> np.ndarray:
         """Read a binary mask from masks.zarr."""
         gp = zarr_io.mask_group_path(threshold_id)
-        return zarr_io.read_mask(self.masks_zarr_path, gp)
+        return zarr_io.read_mask(self._zarr_root(self.masks_zarr_path), gp)
 
     # --- Segmentations (global entities) ---
 
@@ -1441,12 +1545,12 @@ class ExperimentStore:
         Labels are stored at ``masks.zarr/thresh_{threshold_id}/particles/0``.
         """
         gp = zarr_io.particle_label_group_path(threshold_id)
-        zarr_io.write_particle_labels(self.masks_zarr_path, gp, labels)
+        zarr_io.write_particle_labels(self._zarr_root(self.masks_zarr_path), gp, labels)
 
     def read_particle_labels(self, threshold_id: int) -> np.ndarray:
         """Read a particle label image from masks.zarr."""
         gp = zarr_io.particle_label_group_path(threshold_id)
-        return zarr_io.read_particle_labels(self.masks_zarr_path, gp)
+        return zarr_io.read_particle_labels(self._zarr_root(self.masks_zarr_path), gp)
 
     # --- FOV Status Cache ---
 
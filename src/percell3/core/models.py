@@ -33,7 +33,7 @@ class FovInfo:
     source_file: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellRecord:
     """A segmented cell's spatial properties (no id — assigned by SQLite on insert)."""
 
@@ -118,7 +118,7 @@ class FovConfigEntry:
     scopes: list[str] = field(default_factory=lambda: ["whole_cell"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeasurementRecord:
     """A single measurement value for one cell on one channel."""
 
@@ -132,7 +132,7 @@ class MeasurementRecord:
     measured_at: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParticleRecord:
     """A single particle detected within a threshold mask on a FOV."""
 
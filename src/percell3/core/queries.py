@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Sequence
 
 from percell3.core.exceptions import (
     BioRepNotFoundError,
@@ -266,6 +267,53 @@ def insert_fov(
     return cur.lastrowid  # type: ignore[return-value]
 
 
+def insert_fovs(
+    conn: sqlite3.Connection,
+    rows: list[tuple[str, int, int, int | None, int | None]],
+) -> list[int]:
+    """Bulk insert FOVs in a single transaction. Returns list of new FOV IDs.
+
+    Each row is ``(display_name, condition_id, bio_rep_id, width, height)``.
+
+    Raises:
+        DuplicateError: If a display name repeats within *rows* or is
+            already stored; nothing is inserted.
+        sqlite3.IntegrityError: For other constraint failures, such as an
+            unknown condition or bio rep ID; nothing is inserted.
+    """
+    if not rows:
+        return []
+    # Reject in-batch duplicates before touching the database; a UNIQUE
+    # failure below can then only be a clash with a stored FOV.
+    seen: set[str] = set()
+    for row in rows:
+        if row[0] in seen:
+            raise DuplicateError("fov", row[0])
+        seen.add(row[0])
+    # Explicit BEGIN keeps the batch atomic even with isolation_level=None.
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    try:
+        conn.executemany(
+            "INSERT INTO fovs (display_name, condition_id, bio_rep_id, width, height) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        conn.commit()
+    except sqlite3.IntegrityError as exc:
+        conn.rollback()
+        if "UNIQUE" not in str(exc):
+            raise
+        clash = conn.execute(
+            "SELECT display_name FROM fovs "
+            "WHERE display_name IN (SELECT value FROM json_each(?)) LIMIT 1",
+            (_json_array([row[0] for row in rows]),),
+        ).fetchone()
+        raise DuplicateError("fov", clash[0] if clash else rows[0][0]) from None
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
 _FOV_SELECT_COLS = (
     "SELECT f.id, f.display_name, c.name AS condition, b.name AS bio_rep, "
     "t.name AS timepoint, "
@@ -603,6 +651,14 @@ def insert_cells(conn: sqlite3.Connection, cells: list[CellRecord]) -> list[int]
     """Bulk insert cell records. Returns list of new cell IDs."""
     if not cells:
         return []
+    # Reject in-batch duplicates before touching the database; the
+    # IntegrityError path below still covers clashes with stored rows.
+    seen: set[tuple[int, int, int]] = set()
+    for cell in cells:
+        key = (cell.fov_id, cell.segmentation_id, cell.label_value)
+        if key in seen:
+            raise DuplicateError("cell", str(cell.label_value))
+        seen.add(key)
     sql = (
         "INSERT INTO cells (fov_id, segmentation_id, label_value, "
         "centroid_x, centroid_y, bbox_x, bbox_y, bbox_w, bbox_h, "
@@ -618,16 +674,29 @@ def insert_cells(conn: sqlite3.Connection, cells: list[CellRecord]) -> list[int]
         )
         for cell in cells
     ]
+    # Explicit BEGIN keeps the batch atomic (and one journal transaction)
+    # even on connections opened with isolation_level=None.
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
     try:
         conn.executemany(sql, rows)
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
         conn.commit()
     except sqlite3.IntegrityError:
         conn.rollback()
         raise DuplicateError("cell", str(cells[-1].label_value))
-    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
     return list(range(last_id - len(cells) + 1, last_id + 1))
 
 
+def _json_array(values: Sequence[int | str]) -> str:
+    """Encode a filter list as one JSON parameter for ``json_each(?)``.
+
+    Unlike an ``IN (?, ?, ...)`` list, the SQL text stays the same for any
+    list length, so sqlite3's per-connection statement cache is reused.
+    """
+    return json.dumps(list(values), default=int)
+
+
 def select_cells(
     conn: sqlite3.Connection,
     condition_id: int | None = None,
@@ -678,11 +747,11 @@ def select_cells(
         clauses.append("c.area_pixels <= ?")
         params.append(max_area)
     if tag_ids is not None and len(tag_ids) > 0:
-        placeholders = ",".join("?" * len(tag_ids))
         clauses.append(
-            f"c.id IN (SELECT cell_id FROM cell_tags WHERE tag_id IN ({placeholders}))"
+            "c.id IN (SELECT cell_id FROM cell_tags "
+            "WHERE tag_id IN (SELECT value FROM json_each(?)))"
         )
-        params.extend(tag_ids)
+        params.append(_json_array(tag_ids))
 
     if clauses:
         query += " WHERE " + " AND ".join(clauses)
@@ -764,17 +833,14 @@ def select_measurements(
     params: list = []
     clauses: list[str] = []
     if cell_ids is not None and len(cell_ids) > 0:
-        placeholders = ",".join("?" * len(cell_ids))
-        clauses.append(f"m.cell_id IN ({placeholders})")
-        params.extend(cell_ids)
+        clauses.append("m.cell_id IN (SELECT value FROM json_each(?))")
+        params.append(_json_array(cell_ids))
     if channel_ids is not None and len(channel_ids) > 0:
-        placeholders = ",".join("?" * len(channel_ids))
-        clauses.append(f"m.channel_id IN ({placeholders})")
-        params.extend(channel_ids)
+        clauses.append("m.channel_id IN (SELECT value FROM json_each(?))")
+        params.append(_json_array(channel_ids))
     if metrics is not None and len(metrics) > 0:
-        placeholders = ",".join("?" * len(metrics))
-        clauses.append(f"m.metric IN ({placeholders})")
-        params.extend(metrics)
+        clauses.append("m.metric IN (SELECT value FROM json_each(?))")
+        params.append(_json_array(metrics))
     if scope is not None:
         # Include particle summary metrics regardless of scope
         clauses.append(
@@ -945,14 +1011,9 @@ def delete_particles_for_fov(conn: sqlite3.Connection, fov_id: int) -> int:
     Returns:
         Number of particles deleted.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM particles WHERE fov_id = ?", (fov_id,),
-    ).fetchone()[0]
-    if count == 0:
-        return 0
-    conn.execute("DELETE FROM particles WHERE fov_id = ?", (fov_id,))
+    cur = conn.execute("DELETE FROM particles WHERE fov_id = ?", (fov_id,))
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 def delete_particles_for_threshold(
@@ -964,18 +1025,12 @@ def delete_particles_for_threshold(
     Returns:
         Number of particles deleted.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM particles WHERE threshold_id = ?",
-        (threshold_id,),
-    ).fetchone()[0]
-    if count == 0:
-        return 0
-    conn.execute(
+    cur = conn.execute(
         "DELETE FROM particles WHERE threshold_id = ?",
         (threshold_id,),
     )
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 def delete_particles_for_fov_threshold(
@@ -988,18 +1043,12 @@ def delete_particles_for_fov_threshold(
     Returns:
         Number of particles deleted.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM particles WHERE fov_id = ? AND threshold_id = ?",
-        (fov_id, threshold_id),
-    ).fetchone()[0]
-    if count == 0:
-        return 0
-    conn.execute(
+    cur = conn.execute(
         "DELETE FROM particles WHERE fov_id = ? AND threshold_id = ?",
         (fov_id, threshold_id),
     )
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 def delete_measurements_for_fov_threshold(
@@ -1012,20 +1061,13 @@ def delete_measurements_for_fov_threshold(
     Returns:
         Number of measurements deleted.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM measurements WHERE threshold_id = ? "
-        "AND cell_id IN (SELECT id FROM cells WHERE fov_id = ?)",
-        (threshold_id, fov_id),
-    ).fetchone()[0]
-    if count == 0:
-        return 0
-    conn.execute(
+    cur = conn.execute(
         "DELETE FROM measurements WHERE threshold_id = ? "
         "AND cell_id IN (SELECT id FROM cells WHERE fov_id = ?)",
         (threshold_id, fov_id),
     )
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 def delete_measurements_for_fov_segmentation(
@@ -1038,20 +1080,13 @@ def delete_measurements_for_fov_segmentation(
     Returns:
         Number of measurements deleted.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM measurements WHERE cell_id IN "
-        "(SELECT id FROM cells WHERE fov_id = ? AND segmentation_id = ?)",
-        (fov_id, segmentation_id),
-    ).fetchone()[0]
-    if count == 0:
-        return 0
-    conn.execute(
+    cur = conn.execute(
         "DELETE FROM measurements WHERE cell_id IN "
         "(SELECT id FROM cells WHERE fov_id = ? AND segmentation_id = ?)",
         (fov_id, segmentation_id),
     )
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 def delete_cells_for_fov_segmentation(
@@ -1064,12 +1099,6 @@ def delete_cells_for_fov_segmentation(
     Returns:
         Number of cells deleted.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM cells WHERE fov_id = ? AND segmentation_id = ?",
-        (fov_id, segmentation_id),
-    ).fetchone()[0]
-    if count == 0:
-        return 0
     conn.execute(
         "DELETE FROM measurements WHERE cell_id IN "
         "(SELECT id FROM cells WHERE fov_id = ? AND segmentation_id = ?)",
@@ -1080,12 +1109,12 @@ def delete_cells_for_fov_segmentation(
         "(SELECT id FROM cells WHERE fov_id = ? AND segmentation_id = ?)",
         (fov_id, segmentation_id),
     )
-    conn.execute(
+    cur = conn.execute(
         "DELETE FROM cells WHERE fov_id = ? AND segmentation_id = ?",
         (fov_id, segmentation_id),
     )
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 # ---------------------------------------------------------------------------
@@ -1238,11 +1267,6 @@ def delete_cells_for_fov(conn: sqlite3.Connection, fov_id: int) -> int:
     Returns:
         Number of cells deleted.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM cells WHERE fov_id = ?", (fov_id,)
-    ).fetchone()[0]
-    if count == 0:
-        return 0
     conn.execute(
         "DELETE FROM measurements WHERE cell_id IN "
         "(SELECT id FROM cells WHERE fov_id = ?)",
@@ -1253,9 +1277,9 @@ def delete_cells_for_fov(conn: sqlite3.Connection, fov_id: int) -> int:
         "(SELECT id FROM cells WHERE fov_id = ?)",
         (fov_id,),
     )
-    conn.execute("DELETE FROM cells WHERE fov_id = ?", (fov_id,))
+    cur = conn.execute("DELETE FROM cells WHERE fov_id = ?", (fov_id,))
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 def select_fov_segmentation_summary(
@@ -1450,10 +1474,10 @@ def delete_cell_tags(
 ) -> None:
     if not cell_ids:
         return
-    placeholders = ",".join("?" * len(cell_ids))
     conn.execute(
-        f"DELETE FROM cell_tags WHERE tag_id = ? AND cell_id IN ({placeholders})",
-        [tag_id, *cell_ids],
+        "DELETE FROM cell_tags WHERE tag_id = ? "
+        "AND cell_id IN (SELECT value FROM json_each(?))",
+        (tag_id, _json_array(cell_ids)),
     )
     conn.commit()
 
@@ -1490,17 +1514,19 @@ def upsert_fov_status_cache_batch(
     """
     if not fov_ids:
         return
-    ph = ",".join("?" * len(fov_ids))
     conn.execute(
-        f"""
-        WITH seg_data AS (
+        """
+        WITH ids AS (
+            SELECT value AS fov_id FROM json_each(?)
+        ),
+        seg_data AS (
             SELECT fc.fov_id,
                    json_group_array(json_object(
                        'id', s.id, 'name', s.name, 'cell_count', s.cell_count
                    )) AS segs
             FROM fov_config fc
             JOIN segmentations s ON fc.segmentation_id = s.id
-            WHERE fc.fov_id IN ({ph})
+            WHERE fc.fov_id IN (SELECT fov_id FROM ids)
             GROUP BY fc.fov_id
         ),
         thresh_data AS (
@@ -1511,7 +1537,8 @@ def upsert_fov_status_cache_batch(
                    )) AS threshs
             FROM fov_config fc
             JOIN thresholds t ON fc.threshold_id = t.id
-            WHERE fc.fov_id IN ({ph}) AND fc.threshold_id IS NOT NULL
+            WHERE fc.fov_id IN (SELECT fov_id FROM ids)
+              AND fc.threshold_id IS NOT NULL
             GROUP BY fc.fov_id
         )
         INSERT OR REPLACE INTO fov_status_cache (fov_id, status_json, updated_at)
@@ -1524,9 +1551,9 @@ def upsert_fov_status_cache_batch(
         FROM fovs f
         LEFT JOIN seg_data sd ON f.id = sd.fov_id
         LEFT JOIN thresh_data td ON f.id = td.fov_id
-        WHERE f.id IN ({ph})
+        WHERE f.id IN (SELECT fov_id FROM ids)
         """,
-        fov_ids + fov_ids + fov_ids,
+        (_json_array(fov_ids),),
     )
     conn.commit()
 
@@ -1642,33 +1669,44 @@ def select_group_tags_for_cells(
     conn: sqlite3.Connection,
     cell_ids: list[int],
 ) -> list[tuple[int, str]]:
-    """Return (cell_id, tag_name) pairs for group tags.
+    """Return (cell_id, tag_name) pairs for group tags, ordered by cell.
 
-    Batches the query to stay within SQLite's bind parameter limit.
+    The IDs are bound as one JSON array, so any number fits in a single
+    query without hitting SQLite's bind parameter limit.
     """
     if not cell_ids:
         return []
 
-    _BATCH_SIZE = 900
-    all_rows: list[tuple[int, str]] = []
+    rows = conn.execute(
+        """
+        SELECT ct.cell_id, t.name
+        FROM cell_tags ct
+        JOIN tags t ON ct.tag_id = t.id
+        WHERE t.name LIKE 'group:%'
+          AND ct.cell_id IN (SELECT value FROM json_each(?))
+        ORDER BY ct.cell_id
+        """,
+        (_json_array(cell_ids),),
+    ).fetchall()
+    return [(r[0], r[1]) for r in rows]
+
 
-    for i in range(0, len(cell_ids), _BATCH_SIZE):
-        batch = cell_ids[i : i + _BATCH_SIZE]
-        placeholders = ",".join("?" * len(batch))
-        rows = conn.execute(
-            f"""
-            SELECT ct.cell_id, t.name
-            FROM cell_tags ct
-            JOIN tags t ON ct.tag_id = t.id
-            WHERE t.name LIKE 'group:%'
-              AND ct.cell_id IN ({placeholders})
-            ORDER BY ct.cell_id
-            """,
-            batch,
-        ).fetchall()
-        all_rows.extend((r[0], r[1]) for r in rows)
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Return the smallest string greater than every string starting with *prefix*.
 
-    return all_rows
+    Bumps the last code point, skipping the surrogate block, which
+    cannot be encoded as UTF-8. Trailing U+10FFFF characters cannot be
+    bumped and are dropped first. Returns None when nothing is left
+    (an empty or all-U+10FFFF prefix): every greater name matches, so
+    the range has no upper bound.
+    """
+    stem = prefix.rstrip(chr(0x10FFFF))
+    if not stem:
+        return None
+    nxt = ord(stem[-1]) + 1
+    if 0xD800 <= nxt <= 0xDFFF:
+        nxt = 0xE000
+    return stem[:-1] + chr(nxt)
 
 
 def delete_tags_by_prefix(
@@ -1676,39 +1714,35 @@ def delete_tags_by_prefix(
     prefix: str,
     cell_ids: list[int] | None = None,
 ) -> int:
-    """Delete cell_tags and tags matching a name prefix."""
-    rows = conn.execute(
-        "SELECT id FROM tags WHERE name LIKE ?", (prefix + "%",)
-    ).fetchall()
-    if not rows:
-        return 0
-    tag_ids = [r["id"] for r in rows]
-    ph = ",".join("?" * len(tag_ids))
+    """Delete cell_tags and tags matching a name prefix.
 
-    if cell_ids is not None and len(cell_ids) > 0:
-        cell_ph = ",".join("?" * len(cell_ids))
-        count = conn.execute(
-            f"SELECT COUNT(*) FROM cell_tags "
-            f"WHERE tag_id IN ({ph}) AND cell_id IN ({cell_ph})",
-            [*tag_ids, *cell_ids],
-        ).fetchone()[0]
-        conn.execute(
-            f"DELETE FROM cell_tags "
-            f"WHERE tag_id IN ({ph}) AND cell_id IN ({cell_ph})",
-            [*tag_ids, *cell_ids],
+    The prefix is matched exactly and case-sensitively. A half-open
+    range on ``tags.name`` lets SQLite use the UNIQUE index. ``LIKE``
+    would scan the whole table and treat ``_`` in channel names as a
+    wildcard.
+    """
+    upper = _prefix_upper_bound(prefix)
+    if upper is None:
+        matching = "SELECT id FROM tags WHERE name >= ?"
+        bounds: tuple[str, ...] = (prefix,)
+    else:
+        matching = "SELECT id FROM tags WHERE name >= ? AND name < ?"
+        bounds = (prefix, upper)
+
+    if cell_ids:
+        cur = conn.execute(
+            f"DELETE FROM cell_tags WHERE tag_id IN ({matching}) "
+            "AND cell_id IN (SELECT value FROM json_each(?))",
+            (*bounds, _json_array(cell_ids)),
         )
     else:
-        count = conn.execute(
-            f"SELECT COUNT(*) FROM cell_tags WHERE tag_id IN ({ph})",
-            tag_ids,
-        ).fetchone()[0]
-        conn.execute(
-            f"DELETE FROM cell_tags WHERE tag_id IN ({ph})", tag_ids
+        cur = conn.execute(
+            f"DELETE FROM cell_tags WHERE tag_id IN ({matching})", bounds,
         )
-        conn.execute(f"DELETE FROM tags WHERE id IN ({ph})", tag_ids)
+        conn.execute(f"DELETE FROM tags WHERE id IN ({matching})", bounds)
 
     conn.commit()
-    return count
+    return cur.rowcount
 
 
 # ---------------------------------------------------------------------------
@@ -7,11 +7,20 @@ from pathlib import Path
 
 from percell3.core.exceptions import ExperimentNotFoundError, SchemaVersionError
 
-_SCHEMA_SQL = """\
+# Connection-level settings. journal_mode cannot change inside a
+# transaction, so these run separately from the DDL below. cache_size is
+# in KiB when negative (64 MiB here). mmap_size is deliberately left at 0:
+# experiments often live on network shares, where mmap I/O errors surface
+# as SIGBUS instead of SQLITE_IOERR.
+_PRAGMA_SQL = """\
 PRAGMA journal_mode = WAL;
 PRAGMA synchronous = NORMAL;
 PRAGMA foreign_keys = ON;
+PRAGMA cache_size = -65536;
+PRAGMA temp_store = MEMORY;
+"""
 
+_SCHEMA_SQL = """\
 CREATE TABLE IF NOT EXISTS experiments (
     id INTEGER PRIMARY KEY,
     name TEXT NOT NULL DEFAULT '',
@@ -179,11 +188,12 @@ CREATE TABLE IF NOT EXISTS tags (
     color TEXT
 );
 
+-- Pure junction table: rows live in the primary-key B-tree, no rowid.
 CREATE TABLE IF NOT EXISTS cell_tags (
     cell_id INTEGER NOT NULL REFERENCES cells(id) ON DELETE CASCADE,
     tag_id INTEGER NOT NULL REFERENCES tags(id),
     PRIMARY KEY (cell_id, tag_id)
-);
+) WITHOUT ROWID;
 
 CREATE TABLE IF NOT EXISTS fov_status_cache (
     fov_id INTEGER PRIMARY KEY REFERENCES fovs(id) ON DELETE CASCADE,
@@ -268,6 +278,15 @@ EXPECTED_INDEXES = frozenset({
 EXPECTED_VERSION = "4.0.0"
 
 
+def _major_version(version: str) -> int | None:
+    """Return the integer major component of *version*, or None if malformed."""
+    head = version.partition(".")[0]
+    return int(head) if head.isdigit() else None
+
+
+_EXPECTED_MAJOR = _major_version(EXPECTED_VERSION)
+
+
 def create_schema(
     db_path: Path,
     name: str = "",
@@ -285,7 +304,10 @@ def create_schema(
     """
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
-    conn.executescript(_SCHEMA_SQL)
+    conn.executescript(_PRAGMA_SQL)
+    # All DDL plus the experiment row in one transaction: the script leaves
+    # the BEGIN open and the commit below closes it.
+    conn.executescript("BEGIN;\n" + _SCHEMA_SQL)
     conn.execute(
         "INSERT INTO experiments (name, description, percell_version) VALUES (?, ?, ?)",
         (name, description, EXPECTED_VERSION),
@@ -310,15 +332,18 @@ def _ensure_tables(conn: sqlite3.Connection) -> None:
     if not missing:
         return
 
-    # Re-run the full schema — IF NOT EXISTS keeps existing tables untouched
-    conn.executescript(_SCHEMA_SQL)
+    # Re-run the full schema — IF NOT EXISTS keeps existing tables untouched.
+    # One transaction, as in create_schema, so the repair is atomic.
+    conn.executescript("BEGIN;\n" + _SCHEMA_SQL + "COMMIT;\n")
 
 
-def open_database(db_path: Path) -> sqlite3.Connection:
+def open_database(db_path: Path, validate: bool = True) -> sqlite3.Connection:
     """Open an existing experiment database.
 
     Args:
         db_path: Path to the SQLite database file.
+        validate: If False, skip the schema version check and missing-table
+            repair. Only safe for databases this process just created.
 
     Returns:
         An open connection with WAL mode and foreign keys enabled.
@@ -331,9 +356,9 @@ def open_database(db_path: Path) -> sqlite3.Connection:
         raise ExperimentNotFoundError(str(db_path))
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode = WAL")
-    conn.execute("PRAGMA synchronous = NORMAL")
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(_PRAGMA_SQL)
+    if not validate:
+        return conn
 
     # Check schema version — no migration from older major versions
     row = conn.execute(
@@ -341,9 +366,7 @@ def open_database(db_path: Path) -> sqlite3.Connection:
     ).fetchone()
     if row is not None:
         stored = row["percell_version"]
-        stored_major = stored.split(".")[0]
-        expected_major = EXPECTED_VERSION.split(".")[0]
-        if stored_major != expected_major:
+        if _major_version(stored) != _EXPECTED_MAJOR:
             conn.close()
             raise SchemaVersionError(stored, EXPECTED_VERSION)
 
@@ -351,3 +374,21 @@ def open_database(db_path: Path) -> sqlite3.Connection:
     _ensure_tables(conn)
 
     return conn
+
+
+def close_database(conn: sqlite3.Connection) -> None:
+    """Refresh query-planner statistics, then close the connection.
+
+    ``PRAGMA optimize`` only runs ANALYZE on tables whose statistics look
+    stale, and ``analysis_limit`` bounds how many rows each index scan
+    samples, so this is usually a no-op. Failures here (e.g. the database
+    is locked by another process) are ignored; the connection is always
+    closed.
+    """
+    try:
+        conn.execute("PRAGMA analysis_limit = 400")
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
@@ -9,6 +9,7 @@ import logging
 import shutil
 import time
 from pathlib import Path
+from typing import Any
 
 import dask.array as da
 import numpy as np
@@ -62,6 +63,27 @@ def particle_label_group_path(threshold_id: int) -> str:
     return f"thresh_{threshold_id}/particles"
 
 
+# ---------------------------------------------------------------------------
+# Store roots
+# ---------------------------------------------------------------------------
+
+
+def open_store_root(zarr_path: Path) -> zarr.Group:
+    """Open a zarr store root for repeated reads and writes.
+
+    The returned group can be passed to any I/O function in this module in
+    place of *zarr_path*, which avoids re-opening the store on every call.
+    """
+    return zarr.open_group(zarr.DirectoryStore(str(zarr_path)), mode="a")
+
+
+def _open_root(zarr_path: Path | zarr.Group, mode: str) -> zarr.Group:
+    """Return *zarr_path* if it is already an open group, else open it."""
+    if isinstance(zarr_path, zarr.Group):
+        return zarr_path
+    return zarr.open(str(zarr_path), mode=mode)
+
+
 # ---------------------------------------------------------------------------
 # NGFF 0.4 metadata builders
 # ---------------------------------------------------------------------------
@@ -153,13 +175,25 @@ def _build_multiscales_mask(
     return {"multiscales": _build_2d_multiscales(pixel_size_um)}
 
 
+def _update_attrs(group: zarr.Group, attrs: dict[str, Any]) -> None:
+    """Merge *attrs* into the group's .zattrs, skipping the write if unchanged.
+
+    Every channel of a multi-channel FOV carries the same NGFF metadata, so
+    after the first channel the rewrite (JSON encode plus file replace) is
+    pure overhead.
+    """
+    current = group.attrs.asdict()
+    if any(current.get(k) != v for k, v in attrs.items()):
+        group.attrs.update(attrs)
+
+
 # ---------------------------------------------------------------------------
 # Image I/O
 # ---------------------------------------------------------------------------
 
 
 def write_image_channel(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
     channel_index: int,
     num_channels: int,
@@ -170,7 +204,7 @@ def write_image_channel(
     """Write a single channel's 2D data into a (C, Y, X) zarr array.
 
     Args:
-        zarr_path: Path to the images.zarr store.
+        zarr_path: Path to the images.zarr store, or its open root group.
         group_path: Group path within the store (e.g. "control/r1").
         channel_index: Index along the C dimension.
         num_channels: Total number of channels (for pre-allocation).
@@ -180,7 +214,7 @@ def write_image_channel(
     """
     if data.ndim != 2:
         raise ValueError(f"Expected 2D array (Y, X), got {data.ndim}D with shape {data.shape}")
-    root = zarr.open(str(zarr_path), mode="a")
+    root = _open_root(zarr_path, "a")
     group = root.require_group(group_path)
 
     h, w = data.shape
@@ -205,11 +239,11 @@ def write_image_channel(
     # Update NGFF metadata
     fov_name = group_path.rsplit("/", 1)[-1]
     attrs = _build_multiscales_image(fov_name, channels_meta, pixel_size_um)
-    group.attrs.update(attrs)
+    _update_attrs(group, attrs)
 
 
 def read_image_channel(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
     channel_index: int,
 ) -> da.Array:
@@ -218,14 +252,14 @@ def read_image_channel(
     Returns:
         2D dask array (Y, X).
     """
-    root = zarr.open(str(zarr_path), mode="r")
+    root = _open_root(zarr_path, "r")
     arr = root[f"{group_path}/0"]
     z = da.from_zarr(arr)
     return z[channel_index]
 
 
 def read_image_channel_numpy(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
     channel_index: int,
 ) -> np.ndarray:
@@ -234,18 +268,31 @@ def read_image_channel_numpy(
     Returns:
         2D numpy array (Y, X).
     """
-    root = zarr.open(str(zarr_path), mode="r")
+    root = _open_root(zarr_path, "r")
     arr = root[f"{group_path}/0"]
     return np.array(arr[channel_index])
 
 
+def read_all_channels_numpy(
+    zarr_path: Path | zarr.Group,
+    group_path: str,
+) -> np.ndarray:
+    """Read every channel of an image group fully into memory in one slice.
+
+    Returns:
+        3D numpy array (C, Y, X).
+    """
+    root = _open_root(zarr_path, "r")
+    return np.asarray(root[f"{group_path}/0"][:])
+
+
 # ---------------------------------------------------------------------------
 # Label I/O
 # ---------------------------------------------------------------------------
 
 
 def write_labels(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
     data: np.ndarray,
     source_image_path: str | None = None,
@@ -254,7 +301,7 @@ def write_labels(
     """Write a 2D label image (Y, X) as int32."""
     if data.ndim != 2:
         raise ValueError(f"Expected 2D array (Y, X), got {data.ndim}D with shape {data.shape}")
-    root = zarr.open(str(zarr_path), mode="a")
+    root = _open_root(zarr_path, "a")
     group = root.require_group(group_path)
 
     arr_path = f"{group_path}/0"
@@ -274,15 +321,15 @@ def write_labels(
 
     fov_name = group_path.rsplit("/", 1)[-1]
     attrs = _build_multiscales_label(fov_name, source_image_path, pixel_size_um)
-    group.attrs.update(attrs)
+    _update_attrs(group, attrs)
 
 
 def read_labels(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
 ) -> np.ndarray:
     """Read a label image as numpy array."""
-    root = zarr.open(str(zarr_path), mode="r")
+    root = _open_root(zarr_path, "r")
     return np.array(root[f"{group_path}/0"])
 
 
@@ -292,7 +339,7 @@ def read_labels(
 
 
 def write_mask(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
     data: np.ndarray,
     pixel_size_um: float | None = None,
@@ -300,10 +347,16 @@ def write_mask(
     """Write a binary mask as uint8 (0/255)."""
     if data.ndim != 2:
         raise ValueError(f"Expected 2D array (Y, X), got {data.ndim}D with shape {data.shape}")
-    root = zarr.open(str(zarr_path), mode="a")
+    root = _open_root(zarr_path, "a")
     group = root.require_group(group_path)
 
-    mask_data = np.where(data, np.uint8(255), np.uint8(0))
+    # 0/1 bytes scaled to 0/255: bool input is reinterpreted, not copied,
+    # and other dtypes pay for one comparison before an in-place multiply.
+    if data.dtype == np.bool_:
+        mask_data = data.view(np.uint8) * np.uint8(255)
+    else:
+        mask_data = np.not_equal(data, 0).view(np.uint8)
+        mask_data *= np.uint8(255)
 
     arr_path = f"{group_path}/0"
     if arr_path in root:
@@ -320,15 +373,15 @@ def write_mask(
         )
 
     attrs = _build_multiscales_mask(pixel_size_um)
-    group.attrs.update(attrs)
+    _update_attrs(group, attrs)
 
 
 def read_mask(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
 ) -> np.ndarray:
     """Read a binary mask as numpy array (uint8 0/255)."""
-    root = zarr.open(str(zarr_path), mode="r")
+    root = _open_root(zarr_path, "r")
     return np.array(root[f"{group_path}/0"])
 
 
@@ -338,7 +391,7 @@ def read_mask(
 
 
 def write_particle_labels(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
     data: np.ndarray,
     pixel_size_um: float | None = None,
@@ -346,7 +399,7 @@ def write_particle_labels(
     """Write a 2D particle label image (Y, X) as int32."""
     if data.ndim != 2:
         raise ValueError(f"Expected 2D array (Y, X), got {data.ndim}D with shape {data.shape}")
-    root = zarr.open(str(zarr_path), mode="a")
+    root = _open_root(zarr_path, "a")
     root.require_group(group_path)
 
     arr_path = f"{group_path}/0"
@@ -366,11 +419,11 @@ def write_particle_labels(
 
 
 def read_particle_labels(
-    zarr_path: Path,
+    zarr_path: Path | zarr.Group,
     group_path: str,
 ) -> np.ndarray:
     """Read a particle label image as numpy array."""
-    root = zarr.open(str(zarr_path), mode="r")
+    root = _open_root(zarr_path, "r")
     return np.array(root[f"{group_path}/0"])
 
 
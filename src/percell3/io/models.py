@@ -22,9 +22,13 @@ class TokenConfig:
     z_slice: str = r"_z(\d+)"
     fov: str | None = None
     series: str | None = r"_s(\d+)"
+    _compiled: dict[str, re.Pattern[str]] = field(
+        init=False, repr=False, compare=False,
+    )
 
     def __post_init__(self) -> None:
-        """Validate regex patterns are compilable and not excessively long."""
+        """Validate and compile regex patterns once, for reuse per filename."""
+        compiled: dict[str, re.Pattern[str]] = {}
         for field_name in ("channel", "timepoint", "z_slice", "fov", "series"):
             pattern = getattr(self, field_name)
             if pattern is None:
@@ -35,11 +39,16 @@ class TokenConfig:
                     f"{_MAX_PATTERN_LENGTH}"
                 )
             try:
-                re.compile(pattern)
+                compiled[field_name] = re.compile(pattern)
             except re.error as e:
                 raise ValueError(
                     f"Invalid regex for '{field_name}': {e}"
                 ) from e
+        object.__setattr__(self, "_compiled", compiled)
+
+    def compiled(self, field_name: str) -> re.Pattern[str] | None:
+        """Return the compiled pattern for *field_name*, or None if unset."""
+        return self._compiled.get(field_name)
 
 
 _VALID_GRID_TYPES = frozenset({
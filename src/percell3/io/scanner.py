@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-import re
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from percell3.io.models import DiscoveredFile, ScanResult, TokenConfig
 from percell3.io.tiff import read_tiff_metadata
 
+# Header reads are dominated by open/seek latency on network shares, so a
+# few threads overlap it; more only add contention on local disks.
+_METADATA_WORKERS = 8
+
+
+def _read_metadata(path: Path) -> dict[str, Any] | Exception:
+    """read_tiff_metadata, returning the exception instead of raising."""
+    try:
+        return read_tiff_metadata(path)
+    except Exception as exc:
+        return exc
+
 
 class FileScanner:
     """Scans directories for TIFF files and parses filename tokens."""
@@ -62,12 +76,17 @@ class FileScanner:
         warnings: list[str] = []
         pixel_sizes: list[float] = []
 
-        for tiff_path in tiff_paths:
+        if len(tiff_paths) == 1:
+            metas = [_read_metadata(tiff_paths[0])]
+        else:
+            workers = min(_METADATA_WORKERS, len(tiff_paths))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                metas = list(pool.map(_read_metadata, tiff_paths))
+
+        for tiff_path, meta in zip(tiff_paths, metas):
             tokens = self._parse_tokens(tiff_path, config)
-            try:
-                meta = read_tiff_metadata(tiff_path)
-            except Exception as exc:
-                warnings.append(f"Could not read metadata from {tiff_path.name}: {exc}")
+            if isinstance(meta, Exception):
+                warnings.append(f"Could not read metadata from {tiff_path.name}: {meta}")
                 continue
 
             ps = meta.get("pixel_size_um")
@@ -120,14 +139,29 @@ class FileScanner:
     def _find_tiffs(self, path: Path) -> list[Path]:
         """Walk directory tree for TIFF files.
 
-        Symlinks are skipped to prevent directory escape and circular loops.
+        Uses ``os.scandir`` so entry types come from the directory listing
+        instead of a ``stat`` per path. Symlinks are skipped to prevent
+        directory escape and circular loops; unreadable subdirectories are
+        skipped, as ``Path.rglob`` did.
         """
-        results = []
-        for child in path.rglob("*"):
-            if child.is_symlink():
+        results: list[Path] = []
+        pending = [str(path)]
+        while pending:
+            try:
+                it = os.scandir(pending.pop())
+            except PermissionError:
                 continue
-            if child.is_file() and child.suffix.lower() in self.TIFF_EXTENSIONS:
-                results.append(child)
+            with it:
+                for entry in it:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in self.TIFF_EXTENSIONS
+                        and entry.is_file(follow_symlinks=False)
+                    ):
+                        results.append(Path(entry.path))
         return results
 
     def _parse_tokens(self, path: Path, config: TokenConfig) -> dict[str, str]:
@@ -135,40 +169,29 @@ class FileScanner:
         stem = path.stem
         tokens: dict[str, str] = {}
 
-        # Channel
-        m = re.search(config.channel, stem)
-        if m:
-            tokens["channel"] = m.group(1)
-
-        # Timepoint
-        m = re.search(config.timepoint, stem)
-        if m:
-            tokens["timepoint"] = m.group(1)
-
-        # Z-slice
-        m = re.search(config.z_slice, stem)
-        if m:
-            tokens["z_slice"] = m.group(1)
-
-        # Series (tile index)
-        if config.series is not None:
-            m = re.search(config.series, stem)
+        # Channel, timepoint, z-slice, series (tile index); patterns are
+        # compiled once by TokenConfig, unset ones are None.
+        for name in ("channel", "timepoint", "z_slice", "series"):
+            pattern = config.compiled(name)
+            if pattern is None:
+                continue
+            m = pattern.search(stem)
             if m:
-                tokens["series"] = m.group(1)
+                tokens[name] = m.group(1)
 
         # FOV — use custom pattern or derive from remaining text
-        if config.fov is not None:
-            m = re.search(config.fov, stem)
+        fov_pattern = config.compiled("fov")
+        if fov_pattern is not None:
+            m = fov_pattern.search(stem)
             if m:
                 tokens["fov"] = m.group(1)
         else:
             # Derive FOV by stripping all matched tokens
             fov = stem
-            strip_patterns = [config.channel, config.timepoint, config.z_slice]
-            if config.series is not None:
-                strip_patterns.append(config.series)
-            for pattern in strip_patterns:
-                fov = re.sub(pattern, "", fov)
+            for name in ("channel", "timepoint", "z_slice", "series"):
+                pattern = config.compiled(name)
+                if pattern is not None:
+                    fov = pattern.sub("", fov)
             fov = fov.strip("_- ")
             if fov:
                 tokens["fov"] = fov
@@ -31,6 +31,16 @@ def _require_yaml() -> Any:
         ) from None
 
 
+def _safe_loader(yaml: Any) -> Any:
+    """libyaml's C SafeLoader when pyyaml was built with it, else the pure one."""
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _safe_dumper(yaml: Any) -> Any:
+    """libyaml's C SafeDumper when pyyaml was built with it, else the pure one."""
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 def plan_to_yaml(plan: ImportPlan, path: Path) -> None:
     """Serialize an ImportPlan to a YAML file.
 
@@ -89,7 +99,10 @@ def plan_to_yaml(plan: ImportPlan, path: Path) -> None:
         data["channel_mappings"].append(entry)
 
     with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            data, f, Dumper=_safe_dumper(yaml),
+            default_flow_style=False, sort_keys=False,
+        )
 
 
 def plan_from_yaml(path: Path) -> ImportPlan:
@@ -109,7 +122,7 @@ def plan_from_yaml(path: Path) -> ImportPlan:
 
     path = Path(path)
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_safe_loader(yaml))
 
     if not isinstance(data, dict):
         raise ValueError(f"Invalid import plan YAML: expected a mapping, got {type(data).__name__}")
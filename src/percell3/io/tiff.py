@@ -6,6 +6,14 @@ from pathlib import Path
 
 import numpy as np
 import tifffile
+from defusedxml.ElementTree import fromstring as safe_fromstring
+
+# Namespace-qualified paths, built once. OME places Pixels directly under
+# Image, so the direct path avoids a descendant search; the wildcard form
+# covers other schema versions and unusual nesting.
+_OME_NS = "{http://www.openmicroscopy.org/Schemas/OME/2016-06}"
+_OME_PIXELS_PATH = f"{_OME_NS}Image/{_OME_NS}Pixels"
+_ANY_PIXELS_PATH = ".//{*}Pixels"
 
 
 def read_tiff(path: Path) -> np.ndarray:
@@ -15,7 +23,8 @@ def read_tiff(path: Path) -> np.ndarray:
         path: Path to the TIFF file.
 
     Returns:
-        Numpy array with the image data.
+        Numpy array with the image data. The array is newly allocated and
+        writable, so callers may modify it in place.
     """
     return tifffile.imread(str(path))
 
@@ -54,14 +63,10 @@ def _extract_pixel_size(tif: tifffile.TiffFile) -> float | None:
     # 1. Try OME-XML
     if tif.ome_metadata:
         try:
-            from defusedxml.ElementTree import fromstring as safe_fromstring
-
             root = safe_fromstring(tif.ome_metadata)
-            ns = {"ome": "http://www.openmicroscopy.org/Schemas/OME/2016-06"}
-            pixels = root.find(".//ome:Pixels", ns)
+            pixels = root.find(_OME_PIXELS_PATH)
             if pixels is None:
-                # Try without namespace
-                pixels = root.find(".//{*}Pixels")
+                pixels = root.find(_ANY_PIXELS_PATH)
             if pixels is not None:
                 ps_x = pixels.get("PhysicalSizeX")
                 unit = pixels.get("PhysicalSizeXUnit", "µm")
@@ -78,10 +78,10 @@ def apply_z_transform(
     first = read_tiff(z_files[0])
 
     if transform.method == "mip":
-        result = first.copy()
+        # read_tiff returns a fresh array, so accumulate into it directly.
         for p in z_files[1:]:
-            np.maximum(result, read_tiff(p), out=result)
-        return result
+            np.maximum(first, read_tiff(p), out=first)
+        return first
 
     if transform.method == "sum":
         acc = first.astype(np.int64) if np.issubdtype(first.dtype, np.integer) else first.astype(np.float64)
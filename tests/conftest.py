@@ -3,8 +3,22 @@
 import numpy as np
 import pytest
 
+# Pixel data for tests that only inspect names, shapes and dtypes; it is
+# only ever read (e.g. by tifffile.imwrite), so one shared array suffices.
+ZEROS_64 = np.zeros((64, 64), dtype=np.uint16)
+
+
+def unique_uint16(h: int, w: int, salt: int = 0) -> np.ndarray:
+    """Deterministic (h, w) uint16 data; different salts differ at every pixel."""
+    return (np.arange(h * w, dtype=np.uint32) + salt).astype(np.uint16).reshape(h, w)
+
 
 @pytest.fixture
 def tmp_experiment(tmp_path):
     """Create a temporary .percell directory path."""
     return tmp_path / "test.percell"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run ``slow``-marked tests last so ``-x`` fails fast on cheap tests."""
+    items.sort(key=lambda item: item.get_closest_marker("slow") is not None)
@@ -15,9 +15,35 @@ def db_path(tmp_path: Path) -> Path:
     return tmp_path / "experiment.db"
 
 
+@pytest.fixture(scope="session")
+def _schema_template() -> sqlite3.Connection:
+    """An in-memory database with the full schema, built once per session.
+
+    Under pytest-xdist every worker is its own session, so each worker
+    builds and clones its own template; no connection crosses processes.
+    """
+    conn = create_schema(Path(":memory:"), name="Test Experiment", description="A test")
+    yield conn
+    conn.close()
+
+
 @pytest.fixture
-def db_conn(db_path: Path) -> sqlite3.Connection:
-    """A fresh database connection with the full schema."""
-    conn = create_schema(db_path, name="Test Experiment", description="A test")
+def db_conn(_schema_template: sqlite3.Connection) -> sqlite3.Connection:
+    """A fresh in-memory copy of the schema template.
+
+    Deliberately stdlib ``sqlite3``: ``queries`` maps
+    ``sqlite3.IntegrityError`` to ``DuplicateError``, and drop-in drivers
+    such as pysqlite3 or apsw raise their own exception classes.
+    """
+    conn = sqlite3.connect(":memory:")
+    _schema_template.backup(conn)
+    conn.row_factory = sqlite3.Row
+    # Test-only settings, unsafe for real experiments: no fsync, temp
+    # b-trees in RAM. An in-memory database already journals in memory.
+    conn.executescript(
+        "PRAGMA foreign_keys = ON;"
+        "PRAGMA synchronous = OFF;"
+        "PRAGMA temp_store = MEMORY;"
+    )
     yield conn
     conn.close()
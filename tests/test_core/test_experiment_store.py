@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+import os
 import shutil
 from pathlib import Path
 
@@ -13,6 +15,7 @@ import zarr
 
 from percell3.core.exceptions import (
     BioRepNotFoundError,
+    ChannelNotFoundError,
     DuplicateError,
     ExperimentError,
     ExperimentNotFoundError,
@@ -20,6 +23,26 @@ from percell3.core.exceptions import (
 from percell3.core.experiment_store import ExperimentStore
 from percell3.core.models import CellRecord, MeasurementRecord, ParticleRecord
 
+# Shared prototype; tests derive per-cell records with dataclasses.replace.
+_CELL_TEMPLATE = CellRecord(
+    fov_id=0, segmentation_id=0, label_value=0,
+    centroid_x=100.0, centroid_y=200.0,
+    bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
+    area_pixels=1200.0,
+)
+
+
+def _make_cells(fov_id: int, seg_id: int, n: int) -> list[CellRecord]:
+    """Build *n* cells with label/position/area offset by the label value."""
+    return [
+        dataclasses.replace(
+            _CELL_TEMPLATE, fov_id=fov_id, segmentation_id=seg_id, label_value=i,
+            centroid_x=100.0 + i, centroid_y=200.0 + i,
+            bbox_x=80 + i, bbox_y=180 + i, area_pixels=1200.0 + i * 10,
+        )
+        for i in range(1, n + 1)
+    ]
+
 
 @pytest.fixture
 def experiment(tmp_path: Path) -> ExperimentStore:
@@ -42,16 +65,7 @@ def experiment_with_data(experiment: ExperimentStore) -> ExperimentStore:
         source_fov_id=fov_id, source_channel="DAPI", model_name="cyto3",
     )
 
-    cells = [
-        CellRecord(
-            fov_id=fov_id, segmentation_id=seg_id, label_value=i,
-            centroid_x=100.0 + i, centroid_y=200.0 + i,
-            bbox_x=80 + i, bbox_y=180 + i, bbox_w=40, bbox_h=40,
-            area_pixels=1200.0 + i * 10,
-        )
-        for i in range(1, 11)
-    ]
-    cell_ids = experiment.add_cells(cells)
+    cell_ids = experiment.add_cells(_make_cells(fov_id, seg_id, 10))
 
     gfp = experiment.get_channel("GFP")
     measurements = [
@@ -88,6 +102,12 @@ class TestLifecycle:
         assert exp.name == "Test"
         exp.close()
 
+    def test_open_unchecked(self, tmp_path):
+        exp_path = tmp_path / "test.percell"
+        ExperimentStore.create(exp_path, name="Test").close()
+        with ExperimentStore._open_unchecked(exp_path) as exp:
+            assert exp.name == "Test"
+
     def test_context_manager(self, tmp_path):
         exp_path = tmp_path / "test.percell"
         with ExperimentStore.create(exp_path) as exp:
@@ -131,6 +151,20 @@ class TestChannels:
         with pytest.raises(DuplicateError):
             experiment.add_channel("DAPI")
 
+    def test_channel_lookup_memoized(self, experiment):
+        experiment.add_channel("DAPI")
+        assert experiment.get_channel("DAPI") is experiment.get_channel("DAPI")
+
+    def test_channel_cache_invalidated_on_add_and_rename(self, experiment):
+        experiment.add_channel("DAPI")
+        assert [c.name for c in experiment.get_channels()] == ["DAPI"]
+        experiment.add_channel("GFP")
+        assert [c.name for c in experiment.get_channels()] == ["DAPI", "GFP"]
+        experiment.rename_channel("GFP", "mNG")
+        assert experiment.get_channel("mNG").display_order == 1
+        with pytest.raises(ChannelNotFoundError):
+            experiment.get_channel("GFP")
+
 
 # === Acceptance Test 3: Condition/FOV management (flat model) ===
 
@@ -139,14 +173,46 @@ class TestConditionsAndFovs:
     def test_conditions_and_fovs(self, experiment):
         experiment.add_condition("control")
         experiment.add_condition("treated")
-        experiment.add_fov("control", width=2048, height=2048)
-        experiment.add_fov("control", width=2048, height=2048)
-        experiment.add_fov("treated", width=2048, height=2048)
+        experiment.add_fovs([
+            ("ctrl_1", "control", 2048, 2048),
+            ("ctrl_2", "control", 2048, 2048),
+            ("treated_1", "treated", 2048, 2048),
+        ])
 
         assert experiment.get_conditions() == ["control", "treated"]
         control_fovs = experiment.get_fovs(condition="control")
         assert len(control_fovs) == 2
 
+    def test_add_fovs_returns_ids_in_order(self, experiment):
+        experiment.add_condition("control")
+        fov_ids = experiment.add_fovs([
+            ("a", "control", 64, 64),
+            ("b", "control", 64, 64),
+        ])
+        names = [experiment.get_fov_by_id(fid).display_name for fid in fov_ids]
+        assert names == ["a", "b"]
+        assert experiment.get_bio_reps() == ["N1"]
+
+    def test_add_fovs_shares_whole_field_seg(self, experiment):
+        experiment.add_condition("control")
+        fov_ids = experiment.add_fovs([
+            ("a", "control", 64, 64),
+            ("b", "control", 64, 64),
+            ("c", "control", 32, 32),
+        ])
+        assert len(experiment.get_segmentations(seg_type="whole_field")) == 2
+        seg_ids = [experiment.get_fov_config(fid)[0].segmentation_id for fid in fov_ids]
+        assert seg_ids[0] == seg_ids[1] != seg_ids[2]
+
+    def test_add_fovs_duplicate_raises(self, experiment):
+        experiment.add_condition("control")
+        with pytest.raises(DuplicateError):
+            experiment.add_fovs([
+                ("a", "control", 64, 64),
+                ("a", "control", 64, 64),
+            ])
+        assert experiment.get_fovs() == []
+
     def test_timepoints(self, experiment):
         experiment.add_timepoint("t0", time_seconds=0.0)
         experiment.add_timepoint("t1", time_seconds=60.0)
@@ -185,12 +251,26 @@ class TestImageIO:
         data = np.random.randint(0, 65535, (512, 512), dtype=np.uint16)
         experiment.write_image(fov_id, "DAPI", data)
 
-        result_dask = experiment.read_image(fov_id, "DAPI")
-        assert isinstance(result_dask, da.Array)
-
         result_np = experiment.read_image_numpy(fov_id, "DAPI")
+        assert isinstance(result_np, np.ndarray)
         np.testing.assert_array_equal(result_np, data)
 
+    def test_read_image_dask(self, experiment):
+        experiment.add_channel("DAPI")
+        experiment.add_condition("control")
+        fov_id = experiment.add_fov("control", width=64, height=64)
+        data = np.arange(64 * 64, dtype=np.uint16).reshape(64, 64)
+        experiment.write_image(fov_id, "DAPI", data)
+
+        result = experiment.read_image(fov_id, "DAPI")
+        assert isinstance(result, da.Array)
+        assert result.shape == (64, 64)
+
+    def test_zarr_root_cached(self, experiment):
+        root = experiment._zarr_root(experiment.images_zarr_path)
+        assert isinstance(root, zarr.Group)
+        assert experiment._zarr_root(experiment.images_zarr_path) is root
+
     def test_multi_channel_image(self, experiment):
         experiment.add_channel("DAPI")
         experiment.add_channel("GFP")
@@ -223,16 +303,7 @@ class TestCells:
             source_fov_id=fov_id, source_channel="DAPI", model_name="cyto3",
         )
 
-        cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id,
-                label_value=i, centroid_x=100 + i, centroid_y=200 + i,
-                bbox_x=80 + i, bbox_y=180 + i, bbox_w=40, bbox_h=40,
-                area_pixels=1200 + i * 10,
-            )
-            for i in range(1, 51)
-        ]
-        cell_ids = experiment.add_cells(cells)
+        cell_ids = experiment.add_cells(_make_cells(fov_id, seg_id, 50))
         assert len(cell_ids) == 50
 
         df = experiment.get_cells(condition="control")
@@ -380,6 +451,19 @@ class TestPortability:
             assert exp2.get_channels() == experiment_with_data.get_channels()
             assert exp2.get_cell_count() == experiment_with_data.get_cell_count()
 
+    def test_moved_percell_directory_reopens(self, experiment_with_data, tmp_path):
+        channels = experiment_with_data.get_channels()
+        cell_count = experiment_with_data.get_cell_count()
+        src = experiment_with_data.path
+        experiment_with_data.close()
+
+        moved_path = tmp_path / "moved.percell"
+        os.rename(src, moved_path)
+
+        with ExperimentStore.open(moved_path) as exp2:
+            assert exp2.get_channels() == channels
+            assert exp2.get_cell_count() == cell_count
+
 
 # === Additional edge case tests ===
 
@@ -448,31 +532,30 @@ class TestSegmentations:
 # === Name validation (path traversal prevention) ===
 
 
-class TestNameValidation:
-    def test_channel_name_with_path_traversal(self, experiment):
-        with pytest.raises(ValueError, match="must not contain"):
-            experiment.add_channel("../evil")
-
-    def test_channel_name_with_slash(self, experiment):
-        with pytest.raises(ValueError, match="invalid characters"):
-            experiment.add_channel("DAPI/GFP")
-
-    def test_condition_name_with_dotdot(self, experiment):
-        with pytest.raises(ValueError, match="must not contain"):
-            experiment.add_condition("a..b")
-
-    def test_condition_name_empty(self, experiment):
-        with pytest.raises(ValueError, match="must not be empty"):
-            experiment.add_condition("")
+@pytest.fixture(scope="module")
+def validation_experiment(tmp_path_factory) -> ExperimentStore:
+    """One store shared by the name-validation cases, which are independent."""
+    exp = ExperimentStore.create(tmp_path_factory.mktemp("names") / "test.percell")
+    exp.add_condition("control")
+    yield exp
+    exp.close()
 
-    def test_fov_display_name_with_path_traversal(self, experiment):
-        experiment.add_condition("control")
-        with pytest.raises(ValueError, match="must not contain"):
-            experiment.add_fov("control", display_name="../../etc")
 
-    def test_timepoint_name_with_slash(self, experiment):
-        with pytest.raises(ValueError, match="invalid characters"):
-            experiment.add_timepoint("t0/evil")
+class TestNameValidation:
+    @pytest.mark.parametrize(
+        "method, args, kwargs, match",
+        [
+            ("add_channel", ("../evil",), {}, "must not contain"),
+            ("add_channel", ("DAPI/GFP",), {}, "invalid characters"),
+            ("add_condition", ("a..b",), {}, "must not contain"),
+            ("add_condition", ("",), {}, "must not be empty"),
+            ("add_fov", ("control",), {"display_name": "../../etc"}, "must not contain"),
+            ("add_timepoint", ("t0/evil",), {}, "invalid characters"),
+        ],
+    )
+    def test_invalid_names(self, validation_experiment, method, args, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            getattr(validation_experiment, method)(*args, **kwargs)
 
     def test_valid_names_pass(self, experiment):
         experiment.add_channel("DAPI-488")
@@ -533,32 +616,12 @@ class TestExperimentStoreRepr:
 
 
 class TestFrozenDataclasses:
-    def test_channel_config_frozen(self):
-        from percell3.core.models import ChannelConfig
-        ch = ChannelConfig(id=1, name="DAPI")
-        with pytest.raises(AttributeError):
-            ch.name = "GFP"
-
-    def test_fov_info_frozen(self):
-        from percell3.core.models import FovInfo
-        r = FovInfo(id=1, display_name="ctrl_N1_FOV_001", condition="control")
-        with pytest.raises(AttributeError):
-            r.display_name = "other"
-
-    def test_cell_record_frozen(self):
-        cell = CellRecord(
-            fov_id=1, segmentation_id=1, label_value=1,
-            centroid_x=100, centroid_y=200,
-            bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-            area_pixels=1200,
-        )
-        with pytest.raises(AttributeError):
-            cell.area_pixels = 999
+    def test_value_objects_are_frozen(self):
+        from percell3.core.models import ChannelConfig, FovInfo
 
-    def test_measurement_record_frozen(self):
-        m = MeasurementRecord(cell_id=1, channel_id=1, metric="mean", value=42.0)
-        with pytest.raises(AttributeError):
-            m.value = 99.0
+        for cls in (ChannelConfig, FovInfo, CellRecord, MeasurementRecord):
+            assert dataclasses.is_dataclass(cls)
+            assert cls.__dataclass_params__.frozen is True, cls.__name__
 
 
 # === Biological Replicates (experiment-global) ===
@@ -25,6 +25,11 @@ class TestChannelConfig:
         b = ChannelConfig(id=1, name="DAPI")
         assert a == b
 
+    def test_equality_compares_values_not_just_id(self):
+        # Value objects: a renamed channel must not compare equal to its old
+        # snapshot even though the database id is unchanged.
+        assert ChannelConfig(id=1, name="DAPI") != ChannelConfig(id=1, name="GFP")
+
 
 class TestFovInfo:
     def test_construction(self):
@@ -62,6 +67,15 @@ class TestCellRecord:
         assert c.perimeter is None
         assert c.circularity is None
 
+    def test_slotted(self):
+        c = CellRecord(
+            fov_id=1, segmentation_id=1, label_value=1,
+            centroid_x=0, centroid_y=0,
+            bbox_x=0, bbox_y=0, bbox_w=10, bbox_h=10,
+            area_pixels=100,
+        )
+        assert not hasattr(c, "__dict__")
+
 
 class TestMeasurementRecord:
     def test_construction(self):
@@ -1,5 +1,10 @@
 """Tests for percell3.core.queries."""
 
+import json
+import re
+import sqlite3
+from dataclasses import dataclass, replace
+
 import pytest
 
 from percell3.core.exceptions import (
@@ -38,41 +43,128 @@ def _make_thresh(db_conn, name="thr", method="otsu", w=64, h=64,
     )
 
 
+_CELL_TEMPLATE = CellRecord(
+    fov_id=0, segmentation_id=0, label_value=0,
+    centroid_x=100, centroid_y=200,
+    bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
+    area_pixels=1200,
+)
+
+# Labels 1-3, the common small batch; callers fill in fov/segmentation IDs.
+_CELLS_3 = tuple(replace(_CELL_TEMPLATE, label_value=i) for i in range(1, 4))
+
+
+def _make_cells(fov_id, seg_id, labels=None):
+    """Template cells for one FOV and segmentation; labels default to 1-3."""
+    if labels is None:
+        return [replace(c, fov_id=fov_id, segmentation_id=seg_id) for c in _CELLS_3]
+    return [
+        replace(_CELL_TEMPLATE, fov_id=fov_id, segmentation_id=seg_id, label_value=i)
+        for i in labels
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class SegContext:
+    """IDs of the channel, condition, FOV and segmentation cells hang off."""
+
+    ch_id: int
+    cond_id: int
+    fov_id: int
+    seg_id: int
+
+
+@pytest.fixture(scope="module")
+def _seg_template(_schema_template):
+    """The schema plus a DAPI channel, control condition, FOV and segmentation."""
+    conn = sqlite3.connect(":memory:")
+    _schema_template.backup(conn)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    ch_id = queries.insert_channel(conn, "DAPI", role="nucleus")
+    cond_id = queries.insert_condition(conn, "control")
+    br_id = queries.insert_bio_rep(conn, "N1")
+    fov_id = queries.insert_fov(
+        conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id,
+    )
+    seg_id = _make_seg(conn, "seg", source_fov_id=fov_id, source_channel="DAPI")
+    yield conn, SegContext(ch_id, cond_id, fov_id, seg_id)
+    conn.close()
+
+
+@pytest.fixture
+def seg_context(db_conn, _seg_template) -> SegContext:
+    """Restore the populated template into ``db_conn`` and return its IDs.
+
+    The inserts run once per module; each test starts from its own copy,
+    so mutations never leak between tests.
+    """
+    template, ctx = _seg_template
+    template.backup(db_conn)
+    return ctx
+
+
+@pytest.fixture
+def n1_in_control(db_conn) -> tuple[int, int]:
+    """Insert the "control" condition and "N1" bio rep; return their IDs."""
+    cond_id = queries.insert_condition(db_conn, "control")
+    br_id = queries.insert_bio_rep(db_conn, "N1")
+    return cond_id, br_id
+
+
+# ---------------------------------------------------------------------------
+# Duplicate and not-found errors
+# ---------------------------------------------------------------------------
+
+DUPLICATE_CASES = [
+    (queries.insert_channel, ("DAPI",)),
+    (queries.insert_condition, ("control",)),
+    (queries.insert_bio_rep, ("N1",)),
+]
+
+NOT_FOUND_CASES = [
+    (queries.select_channel_by_name, ("NOPE",), ChannelNotFoundError),
+    (queries.select_condition_id, ("nope",), ConditionNotFoundError),
+    (queries.select_bio_rep_by_name, ("NOPE",), BioRepNotFoundError),
+    (queries.select_fov_by_id, (9999,), FovNotFoundError),
+    (queries.select_segmentation, (9999,), SegmentationNotFoundError),
+    (queries.select_threshold, (9999,), ThresholdNotFoundError),
+]
+
+
+@pytest.mark.parametrize("inserter,args", DUPLICATE_CASES)
+def test_duplicate_raises(db_conn, inserter, args):
+    inserter(db_conn, *args)
+    with pytest.raises(DuplicateError):
+        inserter(db_conn, *args)
+
+
+@pytest.mark.parametrize("selector,args,exc", NOT_FOUND_CASES)
+def test_not_found_raises(db_conn, selector, args, exc):
+    with pytest.raises(exc):
+        selector(db_conn, *args)
+
+
 # ---------------------------------------------------------------------------
 # Channel queries
 # ---------------------------------------------------------------------------
 
 
 class TestChannelQueries:
-    def test_insert_and_select(self, db_conn):
+    def test_roundtrip(self, db_conn):
+        """Insert, list (in display order) and look up channels by name."""
         cid = queries.insert_channel(db_conn, "DAPI", role="nucleus", color="#0000FF")
         assert cid >= 1
-        channels = queries.select_channels(db_conn)
-        assert len(channels) == 1
-        assert channels[0].name == "DAPI"
-        assert channels[0].role == "nucleus"
-
-    def test_display_order_increments(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI")
         queries.insert_channel(db_conn, "GFP")
+
         channels = queries.select_channels(db_conn)
-        assert channels[0].display_order == 0
-        assert channels[1].display_order == 1
+        assert [c.name for c in channels] == ["DAPI", "GFP"]
+        assert channels[0].role == "nucleus"
+        assert [c.display_order for c in channels] == [0, 1]
 
-    def test_select_by_name(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI", color="#0000FF")
         ch = queries.select_channel_by_name(db_conn, "DAPI")
         assert ch.color == "#0000FF"
 
-    def test_select_by_name_not_found(self, db_conn):
-        with pytest.raises(ChannelNotFoundError):
-            queries.select_channel_by_name(db_conn, "NOPE")
-
-    def test_duplicate_raises(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI")
-        with pytest.raises(DuplicateError):
-            queries.insert_channel(db_conn, "DAPI")
-
 
 # ---------------------------------------------------------------------------
 # Condition queries
@@ -80,30 +172,16 @@ class TestChannelQueries:
 
 
 class TestConditionQueries:
-    def test_insert_and_select(self, db_conn):
+    def test_roundtrip(self, db_conn):
+        """Insert conditions, list them in order and look up IDs by name."""
         cid = queries.insert_condition(db_conn, "control")
         assert cid >= 1
-        names = queries.select_conditions(db_conn)
-        assert names == ["control"]
+        assert queries.select_conditions(db_conn) == ["control"]
 
-    def test_multiple_conditions(self, db_conn):
-        queries.insert_condition(db_conn, "control")
         queries.insert_condition(db_conn, "treated")
         assert queries.select_conditions(db_conn) == ["control", "treated"]
-
-    def test_duplicate_raises(self, db_conn):
-        queries.insert_condition(db_conn, "control")
-        with pytest.raises(DuplicateError):
-            queries.insert_condition(db_conn, "control")
-
-    def test_select_condition_id(self, db_conn):
-        cid = queries.insert_condition(db_conn, "control")
         assert queries.select_condition_id(db_conn, "control") == cid
 
-    def test_select_condition_id_not_found(self, db_conn):
-        with pytest.raises(ConditionNotFoundError):
-            queries.select_condition_id(db_conn, "nope")
-
 
 # ---------------------------------------------------------------------------
 # Timepoint queries
@@ -111,13 +189,11 @@ class TestConditionQueries:
 
 
 class TestTimepointQueries:
-    def test_insert_and_select(self, db_conn):
+    def test_roundtrip(self, db_conn):
+        """Insert a timepoint, list it and look up its ID by name."""
         tid = queries.insert_timepoint(db_conn, "t0", time_seconds=0.0)
         assert tid >= 1
         assert queries.select_timepoints(db_conn) == ["t0"]
-
-    def test_select_id(self, db_conn):
-        tid = queries.insert_timepoint(db_conn, "t0")
         assert queries.select_timepoint_id(db_conn, "t0") == tid
 
     def test_select_id_not_found(self, db_conn):
@@ -146,20 +222,11 @@ class TestBioRepQueries:
         row = queries.select_bio_rep_by_name(db_conn, "N1")
         assert row["name"] == "N1"
 
-    def test_select_by_name_not_found(self, db_conn):
-        with pytest.raises(BioRepNotFoundError):
-            queries.select_bio_rep_by_name(db_conn, "NOPE")
-
     def test_select_by_name_returns_id(self, db_conn):
         queries.insert_bio_rep(db_conn, "N1")
         row = queries.select_bio_rep_by_name(db_conn, "N1")
         assert row["id"] >= 1
 
-    def test_duplicate_raises(self, db_conn):
-        queries.insert_bio_rep(db_conn, "N1")
-        with pytest.raises(DuplicateError):
-            queries.insert_bio_rep(db_conn, "N1")
-
     def test_experiment_global(self, db_conn):
         """Bio reps are experiment-global (one N1 shared across conditions)."""
         queries.insert_bio_rep(db_conn, "N1")
@@ -186,21 +253,13 @@ class TestBioRepQueries:
         assert n2_fovs[0].display_name == "ctrl_N2_FOV_001"
         assert n2_fovs[0].bio_rep == "N2"
 
-    def test_cells_include_bio_rep_name(self, db_conn):
+    def test_cells_include_bio_rep_name(self, db_conn, n1_in_control):
         """select_cells returns bio_rep_name column."""
         queries.insert_channel(db_conn, "DAPI")
-        cid = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+        cid, br_id = n1_in_control
         fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cid, bio_rep_id=br_id)
         seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id, source_channel="DAPI")
-        cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=1,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
-            )
-        ]
+        cells = _make_cells(fov_id, seg_id, [1])
         queries.insert_cells(db_conn, cells)
         rows = queries.select_cells(db_conn, condition_id=cid)
         assert rows[0]["bio_rep_name"] == "N1"
@@ -216,26 +275,9 @@ class TestBioRepQueries:
         seg_id1 = _make_seg(db_conn, "seg1", source_fov_id=fov1)
         seg_id2 = _make_seg(db_conn, "seg2", source_fov_id=fov2)
 
-        cells_n1 = [
-            CellRecord(
-                fov_id=fov1, segmentation_id=seg_id1, label_value=i,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
-            )
-            for i in range(1, 4)
-        ]
-        cells_n2 = [
-            CellRecord(
-                fov_id=fov2, segmentation_id=seg_id2, label_value=i,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
-            )
-            for i in range(1, 6)
-        ]
-        queries.insert_cells(db_conn, cells_n1)
-        queries.insert_cells(db_conn, cells_n2)
+        cells_n1 = _make_cells(fov1, seg_id1)
+        cells_n2 = _make_cells(fov2, seg_id2, range(1, 6))
+        queries.insert_cells(db_conn, cells_n1 + cells_n2)
 
         assert queries.count_cells(db_conn, bio_rep_id=n1_id) == 3
         assert queries.count_cells(db_conn, bio_rep_id=n2_id) == 5
@@ -248,14 +290,8 @@ class TestBioRepQueries:
 
 
 class TestFovQueries:
-    def _make_fov_deps(self, db_conn, condition_name="control"):
-        """Helper: create condition + N1 bio rep, return (cond_id, br_id)."""
-        cid = queries.insert_condition(db_conn, condition_name)
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        return cid, br_id
-
-    def test_insert_and_select(self, db_conn):
-        cid, br_id = self._make_fov_deps(db_conn)
+    def test_insert_and_select(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         rid = queries.insert_fov(
             db_conn, "ctrl_N1_FOV_001", condition_id=cid, bio_rep_id=br_id,
             width=2048, height=2048,
@@ -267,34 +303,30 @@ class TestFovQueries:
         assert fovs[0].condition == "control"
         assert fovs[0].width == 2048
 
-    def test_select_by_id(self, db_conn):
-        cid, br_id = self._make_fov_deps(db_conn)
+    def test_select_by_id(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         fov_id = queries.insert_fov(
             db_conn, "ctrl_N1_FOV_001", condition_id=cid, bio_rep_id=br_id,
         )
         r = queries.select_fov_by_id(db_conn, fov_id)
         assert r.display_name == "ctrl_N1_FOV_001"
 
-    def test_select_by_display_name(self, db_conn):
-        cid, br_id = self._make_fov_deps(db_conn)
+    def test_select_by_display_name(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         queries.insert_fov(
             db_conn, "ctrl_N1_FOV_001", condition_id=cid, bio_rep_id=br_id,
         )
         r = queries.select_fov_by_display_name(db_conn, "ctrl_N1_FOV_001")
         assert r.display_name == "ctrl_N1_FOV_001"
 
-    def test_select_by_id_not_found(self, db_conn):
-        with pytest.raises(FovNotFoundError):
-            queries.select_fov_by_id(db_conn, 9999)
-
-    def test_duplicate_display_name_raises(self, db_conn):
-        cid, br_id = self._make_fov_deps(db_conn)
+    def test_duplicate_display_name_raises(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         queries.insert_fov(db_conn, "FOV_A", condition_id=cid, bio_rep_id=br_id)
         with pytest.raises(DuplicateError):
             queries.insert_fov(db_conn, "FOV_A", condition_id=cid, bio_rep_id=br_id)
 
-    def test_with_timepoint(self, db_conn):
-        cid, br_id = self._make_fov_deps(db_conn)
+    def test_with_timepoint(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         tid = queries.insert_timepoint(db_conn, "t0")
         fov_id = queries.insert_fov(
             db_conn, "ctrl_N1_FOV_001", condition_id=cid, bio_rep_id=br_id,
@@ -303,6 +335,52 @@ class TestFovQueries:
         r = queries.select_fov_by_id(db_conn, fov_id)
         assert r.timepoint == "t0"
 
+    def test_bulk_insert(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
+        ids = queries.insert_fovs(db_conn, [
+            ("FOV_A", cid, br_id, 64, 64),
+            ("FOV_B", cid, br_id, None, None),
+        ])
+        assert [queries.select_fov_by_id(db_conn, i).display_name for i in ids] == [
+            "FOV_A", "FOV_B",
+        ]
+
+    def test_bulk_insert_empty_list(self, db_conn):
+        assert queries.insert_fovs(db_conn, []) == []
+
+    def test_bulk_insert_names_stored_clash(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
+        queries.insert_fovs(db_conn, [("FOV_B", cid, br_id, None, None)])
+        with pytest.raises(DuplicateError) as exc_info:
+            queries.insert_fovs(db_conn, [
+                ("FOV_A", cid, br_id, None, None),
+                ("FOV_B", cid, br_id, None, None),
+                ("FOV_C", cid, br_id, None, None),
+            ])
+        assert exc_info.value.name == "FOV_B"
+        assert [f.display_name for f in queries.select_fovs(db_conn)] == ["FOV_B"]
+
+    def test_bulk_insert_names_in_batch_duplicate(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
+        with pytest.raises(DuplicateError) as exc_info:
+            queries.insert_fovs(db_conn, [
+                ("FOV_A", cid, br_id, None, None),
+                ("FOV_A", cid, br_id, None, None),
+                ("FOV_C", cid, br_id, None, None),
+            ])
+        assert exc_info.value.name == "FOV_A"
+        assert queries.select_fovs(db_conn) == []
+
+    def test_bulk_insert_bad_reference_not_duplicate(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
+        with pytest.raises(sqlite3.IntegrityError):
+            queries.insert_fovs(db_conn, [
+                ("FOV_A", cid, br_id, None, None),
+                ("FOV_B", cid, br_id + 99, None, None),
+            ])
+        assert queries.select_fovs(db_conn) == []
+        assert not db_conn.in_transaction
+
 
 # ---------------------------------------------------------------------------
 # Segmentation queries (NEW)
@@ -331,10 +409,6 @@ class TestSegmentationQueries:
         assert seg.id == seg_id
         assert seg.name == "my_seg"
 
-    def test_select_by_id_not_found(self, db_conn):
-        with pytest.raises(SegmentationNotFoundError):
-            queries.select_segmentation(db_conn, 9999)
-
     def test_filter_by_type(self, db_conn):
         _make_seg(db_conn, "cell_seg", seg_type="cellular")
         _make_seg(db_conn, "wf_seg", seg_type="whole_field")
@@ -349,9 +423,8 @@ class TestSegmentationQueries:
         assert len(large) == 1
         assert large[0].name == "large"
 
-    def test_with_source_fov_and_channel(self, db_conn):
-        cid = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+    def test_with_source_fov_and_channel(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         fov_id = queries.insert_fov(db_conn, "FOV_1", condition_id=cid, bio_rep_id=br_id)
         seg_id = queries.insert_segmentation(
             db_conn, "seg", "cellular", 64, 64,
@@ -423,10 +496,6 @@ class TestThresholdQueries:
         assert thr.id == thr_id
         assert thr.name == "my_thr"
 
-    def test_select_by_id_not_found(self, db_conn):
-        with pytest.raises(ThresholdNotFoundError):
-            queries.select_threshold(db_conn, 9999)
-
     def test_filter_by_dimensions(self, db_conn):
         _make_thresh(db_conn, "small", w=64, h=64)
         _make_thresh(db_conn, "large", w=2048, h=2048)
@@ -487,19 +556,11 @@ class TestThresholdQueries:
 
 
 class TestCellQueries:
-    def _setup(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI", role="nucleus")
-        cond_id = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
-        seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id, source_channel="DAPI")
-        return cond_id, fov_id, seg_id
-
-    def test_insert_and_select(self, db_conn):
-        cond_id, fov_id, seg_id = self._setup(db_conn)
+    def test_insert_and_select(self, db_conn, seg_context):
+        ctx = seg_context
         cells = [
             CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=i,
+                fov_id=ctx.fov_id, segmentation_id=ctx.seg_id, label_value=i,
                 centroid_x=100.0 + i, centroid_y=200.0 + i,
                 bbox_x=80 + i, bbox_y=180 + i, bbox_w=40, bbox_h=40,
                 area_pixels=1200.0 + i * 10,
@@ -509,29 +570,38 @@ class TestCellQueries:
         ids = queries.insert_cells(db_conn, cells)
         assert len(ids) == 5
 
-        rows = queries.select_cells(db_conn, condition_id=cond_id)
+        rows = queries.select_cells(db_conn, condition_id=ctx.cond_id)
         assert len(rows) == 5
 
-    def test_count(self, db_conn):
-        cond_id, fov_id, seg_id = self._setup(db_conn)
+    def test_bulk_insert_ids_match_rows(self, db_conn, seg_context):
+        """IDs come back in input order from the single executemany batch."""
+        ctx = seg_context
         cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=1,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
+            replace(
+                _CELL_TEMPLATE,
+                fov_id=ctx.fov_id, segmentation_id=ctx.seg_id, label_value=i,
+                area_pixels=1000.0 + i * 100,
             )
+            for i in range(1, 11)
         ]
+        ids = queries.insert_cells(db_conn, cells)
+        labels = dict(
+            db_conn.execute("SELECT id, label_value FROM cells").fetchall()
+        )
+        assert [labels[i] for i in ids] == list(range(1, 11))
+
+    def test_count(self, db_conn, seg_context):
+        ctx = seg_context
+        cells = _make_cells(ctx.fov_id, ctx.seg_id, [1])
         queries.insert_cells(db_conn, cells)
         assert queries.count_cells(db_conn) == 1
 
-    def test_area_filter(self, db_conn):
-        cond_id, fov_id, seg_id = self._setup(db_conn)
+    def test_area_filter(self, db_conn, seg_context):
+        ctx = seg_context
         cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=i,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
+            replace(
+                _CELL_TEMPLATE,
+                fov_id=ctx.fov_id, segmentation_id=ctx.seg_id, label_value=i,
                 area_pixels=1000.0 + i * 100,
             )
             for i in range(1, 11)
@@ -547,26 +617,14 @@ class TestCellQueries:
 
 
 class TestMeasurementQueries:
-    def _setup(self, db_conn):
-        ch_id = queries.insert_channel(db_conn, "GFP", role="signal")
-        cond_id = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
-        seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id, source_channel="GFP")
-        cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=i,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
-            )
-            for i in range(1, 4)
-        ]
+    def _setup(self, db_conn, ctx):
+        ch_id, fov_id, seg_id = ctx.ch_id, ctx.fov_id, ctx.seg_id
+        cells = _make_cells(fov_id, seg_id)
         cell_ids = queries.insert_cells(db_conn, cells)
         return ch_id, fov_id, seg_id, cell_ids
 
-    def test_insert_and_select(self, db_conn):
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
+    def test_insert_and_select(self, db_conn, seg_context):
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
         measurements = [
             MeasurementRecord(cell_id=cid, channel_id=ch_id,
                               metric="mean_intensity", value=42.0 + cid,
@@ -578,26 +636,41 @@ class TestMeasurementQueries:
         assert len(rows) == 3
         assert all(r["metric"] == "mean_intensity" for r in rows)
 
-    def test_filter_by_metric(self, db_conn):
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
-        measurements = []
-        for cid in cell_ids:
-            measurements.append(
-                MeasurementRecord(cell_id=cid, channel_id=ch_id,
-                                  metric="mean_intensity", value=42.0,
-                                  segmentation_id=seg_id)
-            )
-            measurements.append(
-                MeasurementRecord(cell_id=cid, channel_id=ch_id,
-                                  metric="max_intensity", value=100.0,
-                                  segmentation_id=seg_id)
-            )
+    def test_filter_by_metric(self, db_conn, seg_context):
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
+        measurements = [
+            MeasurementRecord(cell_id=cid, channel_id=ch_id,
+                              metric=metric, value=value,
+                              segmentation_id=seg_id)
+            for cid in cell_ids
+            for metric, value in (("mean_intensity", 42.0), ("max_intensity", 100.0))
+        ]
         queries.insert_measurements(db_conn, measurements)
         rows = queries.select_measurements(db_conn, metrics=["mean_intensity"])
         assert len(rows) == 3
 
-    def test_insert_with_scope(self, db_conn):
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
+    def test_filter_by_cell_ids_reuses_sql(self, db_conn, seg_context):
+        """ID filters bind one JSON parameter, so the SQL text is length-independent."""
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
+        queries.insert_measurements(db_conn, [
+            MeasurementRecord(cell_id=cid, channel_id=ch_id,
+                              metric="mean_intensity", value=1.0,
+                              segmentation_id=seg_id)
+            for cid in cell_ids
+        ])
+        statements: list[str] = []
+        db_conn.set_trace_callback(statements.append)
+        one = queries.select_measurements(db_conn, cell_ids=cell_ids[:1])
+        many = queries.select_measurements(db_conn, cell_ids=cell_ids)
+        db_conn.set_trace_callback(None)
+
+        assert [r["cell_id"] for r in one] == cell_ids[:1]
+        assert [r["cell_id"] for r in many] == cell_ids
+        # The trace shows bound values; only the JSON literal may differ.
+        assert len({re.sub(r"json_each\('[^']*'\)", "", q) for q in statements}) == 1
+
+    def test_insert_with_scope(self, db_conn, seg_context):
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
         measurements = [
             MeasurementRecord(
                 cell_id=cell_ids[0], channel_id=ch_id,
@@ -621,8 +694,8 @@ class TestMeasurementQueries:
         scopes = {r["scope"] for r in rows}
         assert scopes == {"whole_cell", "mask_inside", "mask_outside"}
 
-    def test_filter_by_scope(self, db_conn):
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
+    def test_filter_by_scope(self, db_conn, seg_context):
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
         measurements = [
             MeasurementRecord(
                 cell_id=cell_ids[0], channel_id=ch_id,
@@ -641,8 +714,8 @@ class TestMeasurementQueries:
         assert rows[0]["scope"] == "mask_inside"
         assert rows[0]["value"] == 30.0
 
-    def test_scope_default_is_whole_cell(self, db_conn):
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
+    def test_scope_default_is_whole_cell(self, db_conn, seg_context):
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
         m = MeasurementRecord(
             cell_id=cell_ids[0], channel_id=ch_id,
             metric="mean_intensity", value=42.0,
@@ -653,9 +726,9 @@ class TestMeasurementQueries:
         assert rows[0]["scope"] == "whole_cell"
         assert rows[0]["threshold_id"] is None
 
-    def test_overwrite_by_scope(self, db_conn):
+    def test_overwrite_by_scope(self, db_conn, seg_context):
         """INSERT OR REPLACE respects scope in unique constraint."""
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
         m1 = MeasurementRecord(
             cell_id=cell_ids[0], channel_id=ch_id,
             metric="mean_intensity", value=42.0, scope="whole_cell",
@@ -683,9 +756,9 @@ class TestMeasurementQueries:
         assert len(rows) == 1
         assert rows[0]["value"] == 99.0
 
-    def test_threshold_id_stored(self, db_conn):
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
-        thr_id = _make_thresh(db_conn, "thr", source_fov_id=fov_id, source_channel="GFP")
+    def test_threshold_id_stored(self, db_conn, seg_context):
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
+        thr_id = _make_thresh(db_conn, "thr", source_fov_id=fov_id, source_channel="DAPI")
         m = MeasurementRecord(
             cell_id=cell_ids[0], channel_id=ch_id,
             metric="mean_intensity", value=30.0,
@@ -696,8 +769,8 @@ class TestMeasurementQueries:
         rows = queries.select_measurements(db_conn, scope="mask_inside")
         assert rows[0]["threshold_id"] == thr_id
 
-    def test_segmentation_id_stored(self, db_conn):
-        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn)
+    def test_segmentation_id_stored(self, db_conn, seg_context):
+        ch_id, fov_id, seg_id, cell_ids = self._setup(db_conn, seg_context)
         m = MeasurementRecord(
             cell_id=cell_ids[0], channel_id=ch_id,
             metric="mean_intensity", value=50.0,
@@ -714,36 +787,23 @@ class TestMeasurementQueries:
 
 
 class TestTagQueries:
-    def _setup_cells(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI")
-        cond_id = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
-        seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id)
-        cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=i,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
-            )
-            for i in range(1, 4)
-        ]
+    def _setup_cells(self, db_conn, ctx):
+        cells = _make_cells(ctx.fov_id, ctx.seg_id)
         return queries.insert_cells(db_conn, cells)
 
     def test_insert_tag(self, db_conn):
         tid = queries.insert_tag(db_conn, "positive", color="#00FF00")
         assert tid >= 1
 
-    def test_tag_cells(self, db_conn):
-        cell_ids = self._setup_cells(db_conn)
+    def test_tag_cells(self, db_conn, seg_context):
+        cell_ids = self._setup_cells(db_conn, seg_context)
         tag_id = queries.insert_tag(db_conn, "positive")
         queries.insert_cell_tags(db_conn, cell_ids[:2], tag_id)
         rows = queries.select_cells(db_conn, tag_ids=[tag_id])
         assert len(rows) == 2
 
-    def test_untag_cells(self, db_conn):
-        cell_ids = self._setup_cells(db_conn)
+    def test_untag_cells(self, db_conn, seg_context):
+        cell_ids = self._setup_cells(db_conn, seg_context)
         tag_id = queries.insert_tag(db_conn, "positive")
         queries.insert_cell_tags(db_conn, cell_ids, tag_id)
         queries.delete_cell_tags(db_conn, cell_ids[:1], tag_id)
@@ -791,9 +851,8 @@ class TestAnalysisConfigQueries:
 
 
 class TestFovConfigQueries:
-    def _setup(self, db_conn):
-        cid = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+    def _setup(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         fov_id = queries.insert_fov(
             db_conn, "ctrl_N1_FOV_001", condition_id=cid, bio_rep_id=br_id,
         )
@@ -802,8 +861,8 @@ class TestFovConfigQueries:
         config = queries.get_or_create_analysis_config(db_conn)
         return fov_id, seg_id, thr_id, config.id
 
-    def test_insert_and_select(self, db_conn):
-        fov_id, seg_id, thr_id, config_id = self._setup(db_conn)
+    def test_insert_and_select(self, db_conn, n1_in_control):
+        fov_id, seg_id, thr_id, config_id = self._setup(db_conn, n1_in_control)
         entry_id = queries.insert_fov_config_entry(
             db_conn, config_id, fov_id, seg_id, thr_id,
         )
@@ -817,22 +876,22 @@ class TestFovConfigQueries:
         assert e.threshold_id == thr_id
         assert e.scopes == ["whole_cell"]
 
-    def test_select_by_fov(self, db_conn):
-        fov_id, seg_id, thr_id, config_id = self._setup(db_conn)
+    def test_select_by_fov(self, db_conn, n1_in_control):
+        fov_id, seg_id, thr_id, config_id = self._setup(db_conn, n1_in_control)
         queries.insert_fov_config_entry(db_conn, config_id, fov_id, seg_id, thr_id)
         entries = queries.select_fov_config(db_conn, config_id, fov_id=fov_id)
         assert len(entries) == 1
 
-    def test_without_threshold(self, db_conn):
-        fov_id, seg_id, _, config_id = self._setup(db_conn)
+    def test_without_threshold(self, db_conn, n1_in_control):
+        fov_id, seg_id, _, config_id = self._setup(db_conn, n1_in_control)
         entry_id = queries.insert_fov_config_entry(
             db_conn, config_id, fov_id, seg_id,
         )
         entries = queries.select_fov_config(db_conn, config_id)
         assert entries[0].threshold_id is None
 
-    def test_custom_scopes(self, db_conn):
-        fov_id, seg_id, thr_id, config_id = self._setup(db_conn)
+    def test_custom_scopes(self, db_conn, n1_in_control):
+        fov_id, seg_id, thr_id, config_id = self._setup(db_conn, n1_in_control)
         queries.insert_fov_config_entry(
             db_conn, config_id, fov_id, seg_id, thr_id,
             scopes=["whole_cell", "mask_inside", "mask_outside"],
@@ -840,8 +899,8 @@ class TestFovConfigQueries:
         entries = queries.select_fov_config(db_conn, config_id)
         assert set(entries[0].scopes) == {"whole_cell", "mask_inside", "mask_outside"}
 
-    def test_update_entry(self, db_conn):
-        fov_id, seg_id, thr_id, config_id = self._setup(db_conn)
+    def test_update_entry(self, db_conn, n1_in_control):
+        fov_id, seg_id, thr_id, config_id = self._setup(db_conn, n1_in_control)
         entry_id = queries.insert_fov_config_entry(
             db_conn, config_id, fov_id, seg_id,
         )
@@ -853,8 +912,8 @@ class TestFovConfigQueries:
         assert entries[0].threshold_id == thr_id
         assert entries[0].scopes == ["mask_inside"]
 
-    def test_delete_entry(self, db_conn):
-        fov_id, seg_id, thr_id, config_id = self._setup(db_conn)
+    def test_delete_entry(self, db_conn, n1_in_control):
+        fov_id, seg_id, thr_id, config_id = self._setup(db_conn, n1_in_control)
         entry_id = queries.insert_fov_config_entry(
             db_conn, config_id, fov_id, seg_id, thr_id,
         )
@@ -862,8 +921,8 @@ class TestFovConfigQueries:
         entries = queries.select_fov_config(db_conn, config_id)
         assert len(entries) == 0
 
-    def test_delete_for_fov(self, db_conn):
-        fov_id, seg_id, thr_id, config_id = self._setup(db_conn)
+    def test_delete_for_fov(self, db_conn, n1_in_control):
+        fov_id, seg_id, thr_id, config_id = self._setup(db_conn, n1_in_control)
         queries.insert_fov_config_entry(db_conn, config_id, fov_id, seg_id, thr_id)
         queries.insert_fov_config_entry(db_conn, config_id, fov_id, seg_id)
         assert len(queries.select_fov_config(db_conn, config_id)) == 2
@@ -871,9 +930,8 @@ class TestFovConfigQueries:
         queries.delete_fov_config_for_fov(db_conn, config_id, fov_id)
         assert len(queries.select_fov_config(db_conn, config_id)) == 0
 
-    def test_multiple_fovs(self, db_conn):
-        cid = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+    def test_multiple_fovs(self, db_conn, n1_in_control):
+        cid, br_id = n1_in_control
         fov1 = queries.insert_fov(db_conn, "FOV_1", condition_id=cid, bio_rep_id=br_id)
         fov2 = queries.insert_fov(db_conn, "FOV_2", condition_id=cid, bio_rep_id=br_id)
         seg_id = _make_seg(db_conn, "seg")
@@ -895,28 +953,20 @@ class TestFovConfigQueries:
 # ---------------------------------------------------------------------------
 
 
-class TestEmptyListGuards:
-    """Verify that passing empty lists doesn't crash with invalid SQL."""
-
-    def test_delete_cell_tags_empty_list(self, db_conn):
-        tag_id = queries.insert_tag(db_conn, "positive")
-        queries.delete_cell_tags(db_conn, [], tag_id)  # should not crash
-
-    def test_insert_cell_tags_empty_list(self, db_conn):
-        tag_id = queries.insert_tag(db_conn, "positive")
-        queries.insert_cell_tags(db_conn, [], tag_id)  # should not crash
-
-    def test_insert_cells_empty_list(self, db_conn):
-        result = queries.insert_cells(db_conn, [])
-        assert result == []
-
-    def test_select_measurements_empty_channel_ids(self, db_conn):
-        rows = queries.select_measurements(db_conn, channel_ids=[])
-        assert rows == []
-
-    def test_select_cells_empty_tag_ids(self, db_conn):
-        rows = queries.select_cells(db_conn, tag_ids=[])
-        assert isinstance(rows, list)
+@pytest.mark.parametrize("call,expected", [
+    (lambda db, tag_id: queries.delete_cell_tags(db, [], tag_id), None),
+    (lambda db, tag_id: queries.insert_cell_tags(db, [], tag_id), None),
+    (lambda db, tag_id: queries.insert_cells(db, []), []),
+    (lambda db, tag_id: queries.select_measurements(db, channel_ids=[]), []),
+    (lambda db, tag_id: queries.select_cells(db, tag_ids=[]), []),
+], ids=[
+    "delete_cell_tags", "insert_cell_tags", "insert_cells",
+    "select_measurements", "select_cells",
+])
+def test_empty_list_guard(db_conn, call, expected):
+    """Passing empty lists doesn't crash with invalid SQL."""
+    tag_id = queries.insert_tag(db_conn, "positive")
+    assert call(db_conn, tag_id) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -927,29 +977,33 @@ class TestEmptyListGuards:
 class TestInsertCellsRollback:
     """Verify that insert_cells rolls back on failure."""
 
-    def test_rollback_on_duplicate(self, db_conn):
-        cond_id = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
-        seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id)
+    def test_rollback_on_duplicate(self, db_conn, seg_context):
+        cells = _make_cells(seg_context.fov_id, seg_context.seg_id, [1, 1])
+        with pytest.raises(DuplicateError):
+            queries.insert_cells(db_conn, cells)
 
-        cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=1,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40, area_pixels=1200,
-            ),
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=1,  # duplicate
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40, area_pixels=1200,
-            ),
-        ]
+        assert db_conn.execute("SELECT 1 FROM cells LIMIT 1").fetchone() is None
+
+    def test_rollback_on_duplicate_of_stored_cell(self, db_conn, seg_context):
+        """A clash with an existing row rolls back the whole batch."""
+        ctx = seg_context
+        queries.insert_cells(db_conn, _make_cells(ctx.fov_id, ctx.seg_id, [2]))
+        cells = _make_cells(ctx.fov_id, ctx.seg_id)
         with pytest.raises(DuplicateError):
             queries.insert_cells(db_conn, cells)
 
-        count = db_conn.execute("SELECT COUNT(*) FROM cells").fetchone()[0]
-        assert count == 0
+        assert queries.count_cells(db_conn) == 1
+
+    def test_rollback_in_autocommit_mode(self, db_conn, seg_context):
+        """The batch is one explicit transaction even without implicit BEGINs."""
+        ctx = seg_context
+        db_conn.isolation_level = None
+        queries.insert_cells(db_conn, _make_cells(ctx.fov_id, ctx.seg_id, [3]))
+        with pytest.raises(DuplicateError):
+            queries.insert_cells(db_conn, _make_cells(ctx.fov_id, ctx.seg_id))
+
+        assert queries.count_cells(db_conn) == 1
+        assert not db_conn.in_transaction
 
 
 # ---------------------------------------------------------------------------
@@ -958,56 +1012,44 @@ class TestInsertCellsRollback:
 
 
 class TestRenameQueries:
+    @pytest.mark.parametrize("rename,list_names,old,new", [
+        pytest.param(queries.rename_condition, queries.select_conditions,
+                     "control", "ctrl", id="condition"),
+        pytest.param(queries.rename_channel,
+                     lambda db: [c.name for c in queries.select_channels(db)],
+                     "DAPI", "Hoechst", id="channel"),
+        pytest.param(queries.rename_bio_rep, queries.select_bio_reps,
+                     "N1", "Rep1", id="bio_rep"),
+        pytest.param(lambda db, old, new: queries.rename_fov(
+                         db, queries.select_fov_by_display_name(db, old).id, new),
+                     lambda db: [f.display_name for f in queries.select_fovs(db)],
+                     "ctrl_N1_FOV_001", "FOV_A", id="fov"),
+    ])
+    def test_rename(self, db_conn, seg_context, rename, list_names, old, new):
+        rename(db_conn, old, new)
+        names = list_names(db_conn)
+        assert new in names
+        assert old not in names
+
+    @pytest.mark.parametrize("insert,rename,old,taken", [
+        pytest.param(queries.insert_condition, queries.rename_condition,
+                     "control", "treated", id="condition"),
+        pytest.param(queries.insert_channel, queries.rename_channel,
+                     "DAPI", "GFP", id="channel"),
+    ])
+    def test_rename_duplicate(self, db_conn, seg_context, insert, rename, old, taken):
+        insert(db_conn, taken)
+        with pytest.raises(DuplicateError):
+            rename(db_conn, old, taken)
+
     def test_rename_experiment(self, db_conn):
         queries.rename_experiment(db_conn, "New Name")
         assert queries.get_experiment_name(db_conn) == "New Name"
 
-    def test_rename_condition(self, db_conn):
-        queries.insert_condition(db_conn, "control")
-        queries.rename_condition(db_conn, "control", "ctrl")
-        conds = queries.select_conditions(db_conn)
-        assert "ctrl" in conds
-        assert "control" not in conds
-
     def test_rename_condition_not_found(self, db_conn):
         with pytest.raises(ConditionNotFoundError):
             queries.rename_condition(db_conn, "NOPE", "new")
 
-    def test_rename_condition_duplicate(self, db_conn):
-        queries.insert_condition(db_conn, "control")
-        queries.insert_condition(db_conn, "treated")
-        with pytest.raises(DuplicateError):
-            queries.rename_condition(db_conn, "control", "treated")
-
-    def test_rename_channel(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI")
-        queries.rename_channel(db_conn, "DAPI", "Hoechst")
-        ch = queries.select_channel_by_name(db_conn, "Hoechst")
-        assert ch.name == "Hoechst"
-
-    def test_rename_channel_duplicate(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI")
-        queries.insert_channel(db_conn, "GFP")
-        with pytest.raises(DuplicateError):
-            queries.rename_channel(db_conn, "DAPI", "GFP")
-
-    def test_rename_bio_rep(self, db_conn):
-        queries.insert_bio_rep(db_conn, "N1")
-        queries.rename_bio_rep(db_conn, "N1", "Rep1")
-        reps = queries.select_bio_reps(db_conn)
-        assert "Rep1" in reps
-        assert "N1" not in reps
-
-    def test_rename_fov(self, db_conn):
-        cid = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "FOV_1", condition_id=cid, bio_rep_id=br_id)
-        queries.rename_fov(db_conn, fov_id, "FOV_A")
-        fovs = queries.select_fovs(db_conn, condition_id=cid)
-        names = [f.display_name for f in fovs]
-        assert "FOV_A" in names
-        assert "FOV_1" not in names
-
 
 # ---------------------------------------------------------------------------
 # Delete cells for FOV
@@ -1015,32 +1057,18 @@ class TestRenameQueries:
 
 
 class TestDeleteCellsForFov:
-    def _setup(self, db_conn):
-        ch_id = queries.insert_channel(db_conn, "DAPI")
-        cond_id = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
-        seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id, source_channel="DAPI")
-        cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=i,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
-            )
-            for i in range(1, 4)
-        ]
-        cell_ids = queries.insert_cells(db_conn, cells)
-        for cid in cell_ids:
-            queries.insert_measurements(db_conn, [
-                MeasurementRecord(cell_id=cid, channel_id=ch_id,
-                                  metric="mean", value=42.0,
-                                  segmentation_id=seg_id),
-            ])
-        return fov_id, cell_ids
+    def _setup(self, db_conn, ctx):
+        cell_ids = queries.insert_cells(db_conn, _make_cells(ctx.fov_id, ctx.seg_id))
+        queries.insert_measurements(db_conn, [
+            MeasurementRecord(cell_id=cid, channel_id=ctx.ch_id,
+                              metric="mean", value=42.0,
+                              segmentation_id=ctx.seg_id)
+            for cid in cell_ids
+        ])
+        return ctx.fov_id, cell_ids
 
-    def test_deletes_cells_and_measurements(self, db_conn):
-        fov_id, cell_ids = self._setup(db_conn)
+    def test_deletes_cells_and_measurements(self, db_conn, seg_context):
+        fov_id, cell_ids = self._setup(db_conn, seg_context)
         assert queries.count_cells(db_conn) == 3
 
         deleted = queries.delete_cells_for_fov(db_conn, fov_id)
@@ -1049,11 +1077,21 @@ class TestDeleteCellsForFov:
         rows = queries.select_measurements(db_conn, cell_ids=cell_ids)
         assert len(rows) == 0
 
-    def test_no_cells_returns_zero(self, db_conn):
-        cond_id = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "empty_FOV", condition_id=cond_id, bio_rep_id=br_id)
-        assert queries.delete_cells_for_fov(db_conn, fov_id) == 0
+    def test_no_cells_returns_zero(self, db_conn, seg_context):
+        assert queries.delete_cells_for_fov(db_conn, seg_context.fov_id) == 0
+
+    def test_returns_cell_count_not_dependent_rows(self, db_conn, seg_context):
+        """The count is cells removed, not the measurements deleted with them."""
+        ctx = seg_context
+        fov_id, cell_ids = self._setup(db_conn, ctx)
+        queries.insert_measurements(db_conn, [
+            MeasurementRecord(cell_id=cid, channel_id=ctx.ch_id,
+                              metric="area", value=1.0,
+                              segmentation_id=ctx.seg_id)
+            for cid in cell_ids
+        ])
+
+        assert queries.delete_cells_for_fov(db_conn, fov_id) == 3
 
 
 # ---------------------------------------------------------------------------
@@ -1062,27 +1100,16 @@ class TestDeleteCellsForFov:
 
 
 class TestFovSegmentationSummary:
-    def test_mixed_segmented_and_unsegmented(self, db_conn):
-        queries.insert_channel(db_conn, "DAPI")
-        cond_id = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov1_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
-        fov2_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_002", condition_id=cond_id, bio_rep_id=br_id)
-        seg_id = _make_seg(db_conn, "seg", source_fov_id=fov1_id, source_channel="DAPI", model_name="cpsam")
-
-        cells = [
-            CellRecord(
-                fov_id=fov1_id, segmentation_id=seg_id, label_value=i,
-                centroid_x=100, centroid_y=200,
-                bbox_x=80, bbox_y=180, bbox_w=40, bbox_h=40,
-                area_pixels=1200,
-            )
-            for i in range(1, 6)
-        ]
-        queries.insert_cells(db_conn, cells)
+    def test_mixed_segmented_and_unsegmented(self, db_conn, seg_context):
+        ctx = seg_context
+        br_id = queries.select_bio_rep_by_name(db_conn, "N1")["id"]
+        fov2_id = queries.insert_fov(
+            db_conn, "ctrl_N1_FOV_002", condition_id=ctx.cond_id, bio_rep_id=br_id,
+        )
+        queries.insert_cells(db_conn, _make_cells(ctx.fov_id, ctx.seg_id, range(1, 6)))
 
         summary = queries.select_fov_segmentation_summary(db_conn)
-        assert summary[fov1_id] == (5, "cpsam")
+        assert summary[ctx.fov_id] == (5, "cyto3")
         assert summary[fov2_id] == (0, None)
 
 
@@ -1092,28 +1119,13 @@ class TestFovSegmentationSummary:
 
 
 class TestParticleQueries:
-    def _setup(self, db_conn):
-        """Create channel, condition, FOV, segmentation, cells, threshold."""
-        ch_id = queries.insert_channel(db_conn, "GFP")
-        cond_id = queries.insert_condition(db_conn, "control")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
-        fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
-        seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id, source_channel="GFP", model_name="cpsam")
-        cells = [
-            CellRecord(
-                fov_id=fov_id, segmentation_id=seg_id, label_value=i,
-                centroid_x=50, centroid_y=50,
-                bbox_x=20, bbox_y=20, bbox_w=60, bbox_h=60,
-                area_pixels=800,
-            )
-            for i in range(1, 3)
-        ]
-        cell_ids = queries.insert_cells(db_conn, cells)
-        thr_id = _make_thresh(db_conn, "thr", source_fov_id=fov_id, source_channel="GFP")
-        return fov_id, cell_ids, thr_id, ch_id
+    def _setup(self, db_conn, ctx):
+        """Add a threshold on the seg_context FOV."""
+        thr_id = _make_thresh(db_conn, "thr", source_fov_id=ctx.fov_id, source_channel="DAPI")
+        return ctx.fov_id, thr_id
 
-    def test_insert_and_select_particles(self, db_conn):
-        fov_id, cell_ids, thr_id, _ = self._setup(db_conn)
+    def test_insert_and_select_particles(self, db_conn, seg_context):
+        fov_id, thr_id = self._setup(db_conn, seg_context)
         particles = [
             ParticleRecord(
                 fov_id=fov_id, threshold_id=thr_id, label_value=1,
@@ -1136,10 +1148,10 @@ class TestParticleQueries:
         assert rows[0]["area_pixels"] == 50.0
         assert rows[1]["label_value"] == 2
 
-    def test_select_by_threshold(self, db_conn):
-        fov_id, cell_ids, thr_id, ch_id = self._setup(db_conn)
+    def test_select_by_threshold(self, db_conn, seg_context):
+        fov_id, thr_id = self._setup(db_conn, seg_context)
         thr_id2 = _make_thresh(db_conn, "thr_manual", method="manual",
-                               source_fov_id=fov_id, source_channel="GFP")
+                               source_fov_id=fov_id, source_channel="DAPI")
         particles = [
             ParticleRecord(
                 fov_id=fov_id, threshold_id=thr_id, label_value=1,
@@ -1160,8 +1172,8 @@ class TestParticleQueries:
         assert len(rows) == 1
         assert rows[0]["threshold_id"] == thr_id
 
-    def test_delete_particles_for_fov(self, db_conn):
-        fov_id, cell_ids, thr_id, _ = self._setup(db_conn)
+    def test_delete_particles_for_fov(self, db_conn, seg_context):
+        fov_id, thr_id = self._setup(db_conn, seg_context)
         particles = [
             ParticleRecord(
                 fov_id=fov_id, threshold_id=thr_id, label_value=1,
@@ -1182,8 +1194,8 @@ class TestParticleQueries:
         assert deleted == 2
         assert queries.select_particles(db_conn) == []
 
-    def test_delete_particles_for_threshold(self, db_conn):
-        fov_id, cell_ids, thr_id, _ = self._setup(db_conn)
+    def test_delete_particles_for_threshold(self, db_conn, seg_context):
+        fov_id, thr_id = self._setup(db_conn, seg_context)
         particles = [
             ParticleRecord(
                 fov_id=fov_id, threshold_id=thr_id, label_value=1,
@@ -1198,12 +1210,37 @@ class TestParticleQueries:
         assert deleted == 1
         assert queries.select_particles(db_conn) == []
 
+    def test_delete_particles_for_fov_threshold(self, db_conn, seg_context):
+        fov_id, thr_id = self._setup(db_conn, seg_context)
+        thr_id2 = _make_thresh(db_conn, "thr2", source_fov_id=fov_id,
+                               source_channel="DAPI")
+        queries.insert_particles(db_conn, [
+            ParticleRecord(
+                fov_id=fov_id, threshold_id=tid, label_value=label,
+                centroid_x=30.0, centroid_y=40.0,
+                bbox_x=25, bbox_y=35, bbox_w=10, bbox_h=10,
+                area_pixels=50.0,
+            )
+            for tid, label in ((thr_id, 1), (thr_id, 2), (thr_id2, 1))
+        ])
+
+        deleted = queries.delete_particles_for_fov_threshold(db_conn, fov_id, thr_id)
+        assert deleted == 2
+        rows = queries.select_particles(db_conn)
+        assert [r["threshold_id"] for r in rows] == [thr_id2]
+
+    def test_delete_particles_none_matching_returns_zero(self, db_conn, seg_context):
+        fov_id, thr_id = self._setup(db_conn, seg_context)
+        assert queries.delete_particles_for_fov(db_conn, fov_id) == 0
+        assert queries.delete_particles_for_threshold(db_conn, thr_id) == 0
+        assert queries.delete_particles_for_fov_threshold(db_conn, fov_id, thr_id) == 0
+
     def test_empty_insert_is_noop(self, db_conn):
         queries.insert_particles(db_conn, [])
         assert queries.select_particles(db_conn) == []
 
-    def test_select_particles_with_context(self, db_conn):
-        fov_id, cell_ids, thr_id, _ = self._setup(db_conn)
+    def test_select_particles_with_context(self, db_conn, seg_context):
+        fov_id, thr_id = self._setup(db_conn, seg_context)
         particles = [
             ParticleRecord(
                 fov_id=fov_id, threshold_id=thr_id, label_value=1,
@@ -1227,16 +1264,15 @@ class TestParticleQueries:
 
 
 class TestDeleteTagsByPrefix:
-    def _setup(self, db_conn):
+    def _setup(self, db_conn, n1_in_control):
         queries.insert_channel(db_conn, "GFP")
-        cond_id = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+        cond_id, br_id = n1_in_control
         fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
         seg_id = _make_seg(db_conn, "seg", source_fov_id=fov_id, source_channel="GFP", model_name="cpsam")
         return fov_id, seg_id
 
-    def test_delete_matching_tags(self, db_conn):
-        fov_id, seg_id = self._setup(db_conn)
+    def test_delete_matching_tags(self, db_conn, n1_in_control):
+        fov_id, seg_id = self._setup(db_conn, n1_in_control)
         cells = [
             CellRecord(
                 fov_id=fov_id, segmentation_id=seg_id, label_value=1,
@@ -1260,8 +1296,8 @@ class TestDeleteTagsByPrefix:
         assert "manual_flag" in remaining
         assert "group:GFP:mean:g1" not in remaining
 
-    def test_delete_with_cell_ids_scope(self, db_conn):
-        fov_id, seg_id = self._setup(db_conn)
+    def test_delete_with_cell_ids_scope(self, db_conn, n1_in_control):
+        fov_id, seg_id = self._setup(db_conn, n1_in_control)
         cells = [
             CellRecord(
                 fov_id=fov_id, segmentation_id=seg_id, label_value=i,
@@ -1287,6 +1323,45 @@ class TestDeleteTagsByPrefix:
         deleted = queries.delete_tags_by_prefix(db_conn, "nonexistent:")
         assert deleted == 0
 
+    def test_prefix_is_literal_and_case_sensitive(self, db_conn):
+        """Unlike LIKE, '_' is not a wildcard and case must match."""
+        for name in ("group:GFP_1:a", "group:GFPX1:a", "group:gfp_1:a", "group:GFP_10"):
+            queries.insert_tag(db_conn, name)
+        queries.delete_tags_by_prefix(db_conn, "group:GFP_1:")
+        assert sorted(queries.select_tags(db_conn)) == [
+            "group:GFPX1:a", "group:GFP_10", "group:gfp_1:a",
+        ]
+
+    def test_prefix_match_uses_name_index(self, db_conn):
+        plan = db_conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM tags WHERE name >= ? AND name < ?",
+            ("group:", queries._prefix_upper_bound("group:")),
+        ).fetchall()
+        assert any("USING COVERING INDEX" in r["detail"] for r in plan)
+
+    @pytest.mark.parametrize("prefix, upper", [
+        ("group:", "group;"),
+        ("a\ud7ff", "a\ue000"),
+        ("a\U0010ffff", "b"),
+        ("a\U0010ffff\U0010ffff", "b"),
+        ("\U0010ffff", None),
+        ("", None),
+    ])
+    def test_prefix_upper_bound(self, prefix, upper):
+        assert queries._prefix_upper_bound(prefix) == upper
+
+    def test_prefix_ending_in_max_code_point(self, db_conn):
+        for name in ("x\U0010ffff", "x\U0010ffffa", "x\U0010fffe", "y"):
+            queries.insert_tag(db_conn, name)
+        assert queries.delete_tags_by_prefix(db_conn, "x\U0010ffff") == 0
+        assert sorted(queries.select_tags(db_conn)) == ["x\U0010fffe", "y"]
+
+    def test_empty_prefix_matches_every_name(self, db_conn):
+        for name in ("a", "\U0010ffffz"):
+            queries.insert_tag(db_conn, name)
+        queries.delete_tags_by_prefix(db_conn, "")
+        assert queries.select_tags(db_conn) == []
+
 
 # ---------------------------------------------------------------------------
 # Experiment summary
@@ -1430,11 +1505,8 @@ class TestDisplayNameGeneration:
 
 
 class TestFovStatusCache:
-    def test_upsert_and_select(self, db_conn):
-        import json as _json
-
-        cond_id = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+    def test_upsert_and_select(self, db_conn, n1_in_control):
+        cond_id, br_id = n1_in_control
         fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
 
         status = {
@@ -1445,7 +1517,7 @@ class TestFovStatusCache:
             "particle_channels": "GFP",
             "particle_count": 42,
         }
-        queries.upsert_fov_status_cache(db_conn, fov_id, _json.dumps(status))
+        queries.upsert_fov_status_cache(db_conn, fov_id, json.dumps(status))
 
         rows = queries.select_fov_status_cache(db_conn)
         assert len(rows) == 1
@@ -1455,6 +1527,18 @@ class TestFovStatusCache:
         assert r["status"]["seg_model"] == "cpsam"
         assert r["status"]["particle_count"] == 42
 
+    def test_batch_upsert_from_fov_config(self, db_conn, seg_context):
+        ctx = seg_context
+        config = queries.get_or_create_analysis_config(db_conn)
+        queries.insert_fov_config_entry(db_conn, config.id, ctx.fov_id, ctx.seg_id)
+
+        queries.upsert_fov_status_cache_batch(db_conn, [ctx.fov_id])
+
+        rows = queries.select_fov_status_cache(db_conn)
+        assert [r["fov_id"] for r in rows] == [ctx.fov_id]
+        assert [s["id"] for s in rows[0]["status"]["segmentations"]] == [ctx.seg_id]
+        assert rows[0]["status"]["thresholds"] == []
+
 
 # ---------------------------------------------------------------------------
 # FOV tags
@@ -1462,9 +1546,8 @@ class TestFovStatusCache:
 
 
 class TestFovTags:
-    def test_add_and_select_fov_tags(self, db_conn):
-        cond_id = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+    def test_add_and_select_fov_tags(self, db_conn, n1_in_control):
+        cond_id, br_id = n1_in_control
         fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
         tag_id = queries.insert_tag(db_conn, "batch1")
 
@@ -1473,9 +1556,8 @@ class TestFovTags:
         assert len(tags) == 1
         assert tags[0]["name"] == "batch1"
 
-    def test_delete_fov_tag(self, db_conn):
-        cond_id = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+    def test_delete_fov_tag(self, db_conn, n1_in_control):
+        cond_id, br_id = n1_in_control
         fov_id = queries.insert_fov(db_conn, "ctrl_N1_FOV_001", condition_id=cond_id, bio_rep_id=br_id)
         tag_id = queries.insert_tag(db_conn, "batch1")
 
@@ -1484,9 +1566,8 @@ class TestFovTags:
         tags = queries.select_fov_tags(db_conn, fov_id)
         assert len(tags) == 0
 
-    def test_select_fovs_by_tag(self, db_conn):
-        cond_id = queries.insert_condition(db_conn, "ctrl")
-        br_id = queries.insert_bio_rep(db_conn, "N1")
+    def test_select_fovs_by_tag(self, db_conn, n1_in_control):
+        cond_id, br_id = n1_in_control
         fov1 = queries.insert_fov(db_conn, "FOV_1", condition_id=cond_id, bio_rep_id=br_id)
         fov2 = queries.insert_fov(db_conn, "FOV_2", condition_id=cond_id, bio_rep_id=br_id)
         tag_id = queries.insert_tag(db_conn, "batch1")
@@ -5,7 +5,35 @@ import sqlite3
 import pytest
 
 from percell3.core.exceptions import ExperimentNotFoundError, SchemaVersionError
-from percell3.core.schema import EXPECTED_INDEXES, EXPECTED_TABLES, EXPECTED_VERSION, create_schema, open_database
+from percell3.core.schema import (
+    EXPECTED_INDEXES,
+    EXPECTED_TABLES,
+    EXPECTED_VERSION,
+    close_database,
+    create_schema,
+    open_database,
+)
+
+
+def _names(conn: sqlite3.Connection, sql: str) -> set[str]:
+    """First column of every row, as a set (e.g. names from sqlite_master)."""
+    return {r[0] for r in conn.execute(sql)}
+
+
+def _inventory(conn: sqlite3.Connection) -> dict[str, set[str]]:
+    """User tables and indexes by type, from a single sqlite_master scan."""
+    inventory: dict[str, set[str]] = {"table": set(), "index": set()}
+    for type_, name in conn.execute(
+        "SELECT type, name FROM sqlite_master "
+        "WHERE type IN ('table', 'index') AND name NOT LIKE 'sqlite_%'"
+    ):
+        inventory[type_].add(name)
+    return inventory
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    """Column names of *table*; ``name`` is field 1 of PRAGMA table_info."""
+    return {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
 
 
 class TestCreateSchema:
@@ -14,28 +42,42 @@ class TestCreateSchema:
         assert db_path.exists()
         conn.close()
 
-    def test_all_tables_exist(self, db_conn):
-        rows = db_conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
-        ).fetchall()
-        tables = {r["name"] for r in rows}
-        assert tables >= EXPECTED_TABLES
-
-    def test_all_indexes_exist(self, db_conn):
-        rows = db_conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
-        ).fetchall()
-        indexes = {r["name"] for r in rows}
-        assert indexes >= EXPECTED_INDEXES
+    def test_all_tables_and_indexes_exist(self, db_conn):
+        inventory = _inventory(db_conn)
+        assert inventory["table"] >= EXPECTED_TABLES
+        assert inventory["index"] >= EXPECTED_INDEXES
 
-    def test_wal_mode(self, db_conn):
-        mode = db_conn.execute("PRAGMA journal_mode").fetchone()[0]
+    def test_wal_mode(self, db_path):
+        conn = create_schema(db_path, name="Test")
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
         assert mode == "wal"
 
-    def test_foreign_keys_enabled(self, db_conn):
-        fk = db_conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    def test_synchronous_normal(self, db_path):
+        conn = create_schema(db_path, name="Test")
+        level = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.close()
+        assert level == 1  # NORMAL
+
+    def test_cache_and_temp_store(self, db_path):
+        conn = create_schema(db_path, name="Test")
+        cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+        conn.close()
+        assert cache_size == -65536
+        assert temp_store == 2  # MEMORY
+
+    def test_foreign_keys_enabled(self, db_path):
+        conn = create_schema(db_path, name="Test")
+        fk = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        conn.close()
         assert fk == 1
 
+    def test_no_open_transaction_after_create(self, db_path):
+        conn = create_schema(db_path, name="Test")
+        assert not conn.in_transaction
+        conn.close()
+
     def test_experiment_singleton_row(self, db_conn):
         row = db_conn.execute("SELECT name, description FROM experiments").fetchone()
         assert row["name"] == "Test Experiment"
@@ -47,18 +89,12 @@ class TestCreateSchema:
 
     def test_no_active_measurement_config_column(self, db_conn):
         """Experiments table should NOT have active_measurement_config_id."""
-        cols = {
-            r["name"]
-            for r in db_conn.execute("PRAGMA table_info(experiments)").fetchall()
-        }
+        cols = _columns(db_conn, "experiments")
         assert "active_measurement_config_id" not in cols
 
     def test_segmentations_table_structure(self, db_conn):
         """segmentations table has global structure with seg_type."""
-        cols = {
-            r["name"]
-            for r in db_conn.execute("PRAGMA table_info(segmentations)").fetchall()
-        }
+        cols = _columns(db_conn, "segmentations")
         assert "seg_type" in cols
         assert "source_fov_id" in cols
         assert "width" in cols
@@ -88,10 +124,7 @@ class TestCreateSchema:
 
     def test_thresholds_table_structure(self, db_conn):
         """thresholds table has global structure with source metadata."""
-        cols = {
-            r["name"]
-            for r in db_conn.execute("PRAGMA table_info(thresholds)").fetchall()
-        }
+        cols = _columns(db_conn, "thresholds")
         assert "source_fov_id" in cols
         assert "source_channel" in cols
         assert "grouping_channel" in cols
@@ -104,20 +137,14 @@ class TestCreateSchema:
 
     def test_particles_table_uses_fov_and_threshold(self, db_conn):
         """particles table uses fov_id + threshold_id, not cell_id."""
-        cols = {
-            r["name"]
-            for r in db_conn.execute("PRAGMA table_info(particles)").fetchall()
-        }
+        cols = _columns(db_conn, "particles")
         assert "fov_id" in cols
         assert "threshold_id" in cols
         assert "cell_id" not in cols
 
     def test_measurements_has_segmentation_id(self, db_conn):
         """measurements table has segmentation_id provenance column."""
-        cols = {
-            r["name"]
-            for r in db_conn.execute("PRAGMA table_info(measurements)").fetchall()
-        }
+        cols = _columns(db_conn, "measurements")
         assert "segmentation_id" in cols
         assert "threshold_id" in cols
         assert "measured_at" in cols
@@ -126,31 +153,26 @@ class TestCreateSchema:
 
     def test_fov_config_table_structure(self, db_conn):
         """fov_config table has config_id, fov_id, segmentation_id, threshold_id, scopes."""
-        cols = {
-            r["name"]
-            for r in db_conn.execute("PRAGMA table_info(fov_config)").fetchall()
-        }
+        cols = _columns(db_conn, "fov_config")
         assert "config_id" in cols
         assert "fov_id" in cols
         assert "segmentation_id" in cols
         assert "threshold_id" in cols
         assert "scopes" in cols
 
+    def test_cell_tags_without_rowid(self, db_conn):
+        with pytest.raises(sqlite3.OperationalError, match="rowid"):
+            db_conn.execute("SELECT rowid FROM cell_tags")
+
     def test_analysis_config_table_structure(self, db_conn):
         """analysis_config table has experiment_id FK."""
-        cols = {
-            r["name"]
-            for r in db_conn.execute("PRAGMA table_info(analysis_config)").fetchall()
-        }
+        cols = _columns(db_conn, "analysis_config")
         assert "experiment_id" in cols
         assert "created_at" in cols
 
     def test_old_tables_do_not_exist(self, db_conn):
         """segmentation_runs, threshold_runs, measurement_configs should not exist."""
-        rows = db_conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        ).fetchall()
-        tables = {r["name"] for r in rows}
+        tables = _names(db_conn, "SELECT name FROM sqlite_master WHERE type='table'")
         assert "segmentation_runs" not in tables
         assert "threshold_runs" not in tables
         assert "measurement_configs" not in tables
@@ -165,6 +187,13 @@ class TestOpenDatabase:
         assert name == "Test"
         conn.close()
 
+    def test_foreign_keys_enabled(self, db_path):
+        create_schema(db_path, name="Test").close()
+        conn = open_database(db_path)
+        fk = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        conn.close()
+        assert fk == 1
+
     def test_open_nonexistent_raises(self, tmp_path):
         with pytest.raises(ExperimentNotFoundError):
             open_database(tmp_path / "nope.db")
@@ -191,6 +220,17 @@ class TestOpenDatabase:
         conn = open_database(db_path)
         conn.close()
 
+    @pytest.mark.parametrize("version", ["5.0.0", "40.0.0", "", "v4.0.0"])
+    def test_incompatible_or_malformed_version_raises(self, tmp_path, version):
+        db_path = tmp_path / "bad.db"
+        conn = create_schema(db_path, name="Bad")
+        conn.execute("UPDATE experiments SET percell_version = ?", (version,))
+        conn.commit()
+        conn.close()
+
+        with pytest.raises(SchemaVersionError):
+            open_database(db_path)
+
     def test_current_version_ok(self, tmp_path):
         """Database with current version should open fine."""
         db_path = tmp_path / "current.db"
@@ -199,6 +239,21 @@ class TestOpenDatabase:
         conn.close()
 
 
+class TestCloseDatabase:
+    def test_closes_connection(self, db_path):
+        conn = create_schema(db_path, name="Test")
+        close_database(conn)
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_reopen_after_close(self, db_path):
+        close_database(create_schema(db_path, name="Test"))
+        conn = open_database(db_path)
+        name = conn.execute("SELECT name FROM experiments").fetchone()["name"]
+        close_database(conn)
+        assert name == "Test"
+
+
 class TestEnsureMissingTables:
     """Tests for _ensure_tables creating missing tables on open."""
 
@@ -269,13 +324,11 @@ class TestEnsureMissingTables:
 
         # Open — should create missing tables automatically
         conn = open_database(db_path)
-        tables = {
-            r["name"]
-            for r in conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' "
-                "AND name NOT LIKE 'sqlite_%'"
-            ).fetchall()
-        }
+        tables = _names(
+            conn,
+            "SELECT name FROM sqlite_master WHERE type='table' "
+            "AND name NOT LIKE 'sqlite_%'",
+        )
         assert "segmentations" in tables
         assert "thresholds" in tables
         assert "particles" in tables
@@ -284,4 +337,5 @@ class TestEnsureMissingTables:
         assert "analysis_config" in tables
         assert "fov_config" in tables
         assert tables >= EXPECTED_TABLES
+        assert not conn.in_transaction
         conn.close()
@@ -8,6 +8,7 @@ import pytest
 import zarr
 
 from percell3.core import zarr_io
+from tests.conftest import unique_uint16
 
 
 @pytest.fixture
@@ -35,10 +36,20 @@ class TestInitZarrStore:
     def test_creates_store(self, tmp_path):
         p = tmp_path / "test.zarr"
         zarr_io.init_zarr_store(p)
-        root = zarr.open(str(p), mode="r")
+        root = zarr.open_group(str(p), mode="r")
         assert root.attrs["percell_version"] == "3.2.0"
 
 
+class TestOpenStoreRoot:
+    def test_root_reused_across_calls(self, labels_zarr):
+        root = zarr_io.open_store_root(labels_zarr)
+        labels = np.arange(64 * 64, dtype=np.int32).reshape(64, 64)
+        zarr_io.write_labels(root, "seg_1", labels)
+        np.testing.assert_array_equal(zarr_io.read_labels(root, "seg_1"), labels)
+        # Written through the open root, visible through a fresh path open
+        np.testing.assert_array_equal(zarr_io.read_labels(labels_zarr, "seg_1"), labels)
+
+
 class TestPathHelpers:
     def test_fov_group_path(self):
         assert zarr_io.fov_group_path(1) == "fov_1"
@@ -62,7 +73,7 @@ class TestPathHelpers:
 
 class TestImageIO:
     def test_write_and_read_single_channel(self, images_zarr):
-        data = np.random.randint(0, 65535, (256, 256), dtype=np.uint16)
+        data = unique_uint16(256, 256)
         gp = zarr_io.image_group_path(1)
         channels_meta = [{"name": "DAPI", "color": "#0000FF"}]
 
@@ -75,7 +86,7 @@ class TestImageIO:
         np.testing.assert_array_equal(result, data)
 
     def test_read_as_dask(self, images_zarr):
-        data = np.random.randint(0, 65535, (128, 128), dtype=np.uint16)
+        data = unique_uint16(128, 128)
         gp = zarr_io.image_group_path(1)
         channels_meta = [{"name": "DAPI", "color": "#0000FF"}]
 
@@ -86,11 +97,13 @@ class TestImageIO:
 
         result = zarr_io.read_image_channel(images_zarr, gp, channel_index=0)
         assert isinstance(result, da.Array)
-        np.testing.assert_array_equal(result.compute(), data)
+        assert result.shape == data.shape and result.dtype == data.dtype
+        # The one test that materializes the dask path; no thread pool needed.
+        np.testing.assert_array_equal(result.compute(scheduler="synchronous"), data)
 
     def test_multi_channel_write(self, images_zarr):
-        dapi = np.random.randint(0, 65535, (256, 256), dtype=np.uint16)
-        gfp = np.random.randint(0, 65535, (256, 256), dtype=np.uint16)
+        dapi = unique_uint16(256, 256)
+        gfp = unique_uint16(256, 256, salt=1)
         gp = zarr_io.image_group_path(1)
         channels_meta = [
             {"name": "DAPI", "color": "#0000FF"},
@@ -112,7 +125,7 @@ class TestImageIO:
         np.testing.assert_array_equal(result_gfp, gfp)
 
     def test_ngff_metadata(self, images_zarr):
-        data = np.random.randint(0, 65535, (128, 128), dtype=np.uint16)
+        data = np.zeros((128, 128), dtype=np.uint16)
         gp = zarr_io.image_group_path(1)
         channels_meta = [{"name": "DAPI", "color": "#0000FF"}]
 
@@ -121,7 +134,7 @@ class TestImageIO:
             data=data, channels_meta=channels_meta, pixel_size_um=0.65,
         )
 
-        root = zarr.open(str(images_zarr), mode="r")
+        root = zarr.open_group(str(images_zarr), mode="r")
         group = root["fov_1"]
         attrs = dict(group.attrs)
 
@@ -135,6 +148,33 @@ class TestImageIO:
         assert "omero" in attrs
         assert attrs["omero"]["channels"][0]["label"] == "DAPI"
 
+    def test_unchanged_metadata_not_rewritten(self, images_zarr):
+        data = np.zeros((64, 64), dtype=np.uint16)
+        gp = zarr_io.image_group_path(1)
+        channels_meta = [{"name": "DAPI"}, {"name": "GFP"}]
+        zattrs = images_zarr / gp / ".zattrs"
+
+        zarr_io.write_image_channel(
+            images_zarr, gp, channel_index=0, num_channels=2,
+            data=data, channels_meta=channels_meta,
+        )
+        before = zattrs.stat().st_mtime_ns
+        zarr_io.write_image_channel(
+            images_zarr, gp, channel_index=1, num_channels=2,
+            data=data, channels_meta=channels_meta,
+        )
+        assert zattrs.stat().st_mtime_ns == before
+
+        zarr_io.write_image_channel(
+            images_zarr, gp, channel_index=1, num_channels=2,
+            data=data, channels_meta=channels_meta, pixel_size_um=0.5,
+        )
+        root = zarr.open_group(str(images_zarr), mode="r")
+        scale = root[gp].attrs["multiscales"][0]["datasets"][0][
+            "coordinateTransformations"
+        ][0]["scale"]
+        assert scale == [1.0, 0.5, 0.5]
+
     def test_add_channel_resizes(self, images_zarr):
         """Adding a third channel after creating with 2 resizes the array."""
         gp = zarr_io.image_group_path(1)
@@ -159,13 +199,12 @@ class TestImageIO:
             channels_meta=[{"name": "DAPI"}, {"name": "GFP"}, {"name": "RFP"}],
         )
 
-        # Verify all 3 channels
-        np.testing.assert_array_equal(
-            zarr_io.read_image_channel_numpy(images_zarr, gp, 0), d1
-        )
-        np.testing.assert_array_equal(
-            zarr_io.read_image_channel_numpy(images_zarr, gp, 2), d3
-        )
+        # Verify all 3 channels from one read of the resized array
+        stack = zarr_io.read_all_channels_numpy(images_zarr, gp)
+        assert stack.shape == (3, 64, 64)
+        np.testing.assert_array_equal(stack[0], d1)
+        np.testing.assert_array_equal(stack[1], d2)
+        np.testing.assert_array_equal(stack[2], d3)
 
 
 class TestLabelIO:
@@ -184,7 +223,7 @@ class TestLabelIO:
         gp = zarr_io.label_group_path(1)
         zarr_io.write_labels(labels_zarr, gp, labels)
 
-        root = zarr.open(str(labels_zarr), mode="r")
+        root = zarr.open_group(str(labels_zarr), mode="r")
         arr = root[f"{gp}/0"]
         assert arr.dtype == np.int32
 
@@ -196,7 +235,7 @@ class TestLabelIO:
             source_image_path="../../images.zarr/fov_1",
         )
 
-        root = zarr.open(str(labels_zarr), mode="r")
+        root = zarr.open_group(str(labels_zarr), mode="r")
         group = root["seg_1"]
         attrs = dict(group.attrs)
         assert "image-label" in attrs
@@ -229,6 +268,19 @@ class TestMaskIO:
         assert result.dtype == np.uint8
         assert result[50, 50] == 255
         assert result[0, 0] == 0
+        # The caller's bool mask is viewed, never scaled in place
+        assert mask.dtype == bool and mask.sum() == 60 * 60
+
+    def test_nonzero_integer_mask(self, masks_zarr):
+        """Callers pass uint8 0/1 (or 0/255) masks; any nonzero is 255."""
+        mask = np.array([[0, 1], [7, 255]], dtype=np.uint8)
+        gp = zarr_io.mask_group_path(1)
+
+        zarr_io.write_mask(masks_zarr, gp, mask)
+        result = zarr_io.read_mask(masks_zarr, gp)
+
+        np.testing.assert_array_equal(result, [[0, 255], [255, 255]])
+        np.testing.assert_array_equal(mask, [[0, 1], [7, 255]])
 
     def test_mask_path(self):
         gp = zarr_io.mask_group_path(1)
@@ -287,7 +339,7 @@ class TestParticleLabelIO:
         gp = zarr_io.particle_label_group_path(1)
         zarr_io.write_particle_labels(masks_zarr, gp, labels)
 
-        root = zarr.open(str(masks_zarr), mode="r")
+        root = zarr.open_group(str(masks_zarr), mode="r")
         arr = root[f"{gp}/0"]
         assert arr.dtype == np.int32
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 import numpy as np
@@ -9,6 +10,12 @@ import pytest
 import tifffile
 
 from percell3.core import ExperimentStore
+from tests.conftest import ZEROS_64
+
+
+def _imwrite(path: str, data: np.ndarray) -> None:
+    """Write a plain uncompressed grayscale TIFF without tifffile's JSON description."""
+    tifffile.imwrite(path, data, photometric="minisblack", metadata=None)
 
 
 @pytest.fixture
@@ -20,8 +27,7 @@ def tiff_dir(tmp_path: Path) -> Path:
     d = tmp_path / "tiffs"
     d.mkdir()
     for ch in (0, 1):
-        data = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
-        tifffile.imwrite(str(d / f"img_ch{ch:02d}_t00.tif"), data)
+        _imwrite(str(d / f"img_ch{ch:02d}_t00.tif"), ZEROS_64)
     return d
 
 
@@ -35,8 +41,7 @@ def tiff_dir_multichannel_multifov(tmp_path: Path) -> Path:
     d.mkdir()
     for fov in ("fov1", "fov2"):
         for ch in (0, 1):
-            data = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
-            tifffile.imwrite(str(d / f"{fov}_ch{ch:02d}.tif"), data)
+            _imwrite(str(d / f"{fov}_ch{ch:02d}.tif"), ZEROS_64)
     return d
 
 
@@ -49,14 +54,27 @@ def tiff_dir_with_z(tmp_path: Path) -> Path:
     d = tmp_path / "tiffs"
     d.mkdir()
     for z in range(3):
-        data = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
-        tifffile.imwrite(str(d / f"img_ch00_z{z:02d}.tif"), data)
+        _imwrite(str(d / f"img_ch00_z{z:02d}.tif"), ZEROS_64)
     return d
 
 
+@pytest.fixture(scope="session")
+def _store_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty experiment, created once per session (per xdist worker)."""
+    path = tmp_path_factory.mktemp("template") / "template.percell"
+    ExperimentStore.create(path).close()
+    return path
+
+
 @pytest.fixture
-def experiment_store(tmp_path: Path) -> ExperimentStore:
-    """Create a fresh ExperimentStore for import testing."""
-    store = ExperimentStore.create(tmp_path / "test.percell")
+def experiment_store(tmp_path: Path, _store_template: Path) -> ExperimentStore:
+    """A fresh ExperimentStore for import testing.
+
+    Copies the session template instead of calling ``create``: a directory
+    copy is several times cheaper than building the schema and zarr roots.
+    """
+    path = tmp_path / "test.percell"
+    shutil.copytree(_store_template, path)
+    store = ExperimentStore._open_unchecked(path)
     yield store
     store.close()
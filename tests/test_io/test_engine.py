@@ -6,7 +6,6 @@ import numpy as np
 import pytest
 import tifffile
 
-from percell3.core import ExperimentStore
 from percell3.io.engine import ImportEngine
 from percell3.io.engine import build_tile_grid, stitch_tiles
 from percell3.io.models import (
@@ -16,6 +15,28 @@ from percell3.io.models import (
     TokenConfig,
     ZTransform,
 )
+from tests.conftest import ZEROS_64, unique_uint16
+
+# Smaller read-only zero image for the same purpose as ZEROS_64.
+_ZEROS_32 = np.zeros((32, 32), dtype=np.uint16)
+
+
+def _plan(source_path: Path, **overrides) -> ImportPlan:
+    """Build an ImportPlan from the defaults most engine tests share.
+
+    Defaults: condition "control", one DAPI channel on token "00", default
+    FOV names, MIP, no pixel size. Each call builds fresh lists and dicts.
+    """
+    kwargs = {
+        "condition": "control",
+        "channel_mappings": [ChannelMapping(token_value="00", name="DAPI")],
+        "fov_names": {},
+        "z_transform": ZTransform(method="mip"),
+        "pixel_size_um": None,
+        "token_config": TokenConfig(),
+        **overrides,
+    }
+    return ImportPlan(source_path=source_path, **kwargs)
 
 
 def _make_tiff_dir(base: Path, layout: dict[str, np.ndarray]) -> Path:
@@ -31,293 +52,239 @@ def _make_tiff_dir(base: Path, layout: dict[str, np.ndarray]) -> Path:
     d = base / "tiffs"
     d.mkdir(exist_ok=True)
     for name, data in layout.items():
-        tifffile.imwrite(str(d / name), data)
+        tifffile.imwrite(
+            str(d / name), data, photometric="minisblack", metadata=None,
+        )
     return d
 
 
 class TestSingleChannelImport:
-    def test_imports_one_fov(self, tmp_path):
-        data = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
+    def test_imports_one_fov(self, tmp_path, experiment_store):
+        data = unique_uint16(64, 64)
         tiff_dir = _make_tiff_dir(tmp_path, {"img_ch00.tif": data})
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"img": "FOV1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.fovs_imported == 1
-            assert result.channels_registered == 1
-            assert result.images_written == 1
-
-            # Verify data round-trips
-            fov = store.get_fovs(condition="control")[0]
-            img = store.read_image_numpy(fov.id, "DAPI")
-            np.testing.assert_array_equal(img, data)
+        plan = _plan(
+            tiff_dir,
+            fov_names={"img": "FOV1"},
+            pixel_size_um=0.65,
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.fovs_imported == 1
+        assert result.channels_registered == 1
+        assert result.images_written == 1
+
+        # Verify data round-trips
+        fov = experiment_store.get_fovs(condition="control")[0]
+        img = experiment_store.read_image_numpy(fov.id, "DAPI")
+        np.testing.assert_array_equal(img, data)
 
 
 class TestMultiChannelImport:
-    def test_imports_two_channels(self, tmp_path):
-        dapi = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
-        gfp = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
+    def test_imports_two_channels(self, tmp_path, experiment_store):
+        dapi = unique_uint16(64, 64)
+        gfp = unique_uint16(64, 64, salt=1)
         tiff_dir = _make_tiff_dir(tmp_path, {
             "img_ch00.tif": dapi,
             "img_ch01.tif": gfp,
         })
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[
-                    ChannelMapping(token_value="00", name="DAPI"),
-                    ChannelMapping(token_value="01", name="GFP"),
-                ],
-                fov_names={"img": "FOV1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.channels_registered == 2
-            assert result.images_written == 2
-
-            fov = store.get_fovs(condition="control")[0]
-            img_dapi = store.read_image_numpy(fov.id, "DAPI")
-            img_gfp = store.read_image_numpy(fov.id, "GFP")
-            np.testing.assert_array_equal(img_dapi, dapi)
-            np.testing.assert_array_equal(img_gfp, gfp)
+        plan = _plan(
+            tiff_dir,
+            channel_mappings=[
+                ChannelMapping(token_value="00", name="DAPI"),
+                ChannelMapping(token_value="01", name="GFP"),
+            ],
+            fov_names={"img": "FOV1"},
+            pixel_size_um=0.65,
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.channels_registered == 2
+        assert result.images_written == 2
+
+        fov = experiment_store.get_fovs(condition="control")[0]
+        img_dapi = experiment_store.read_image_numpy(fov.id, "DAPI")
+        img_gfp = experiment_store.read_image_numpy(fov.id, "GFP")
+        np.testing.assert_array_equal(img_dapi, dapi)
+        np.testing.assert_array_equal(img_gfp, gfp)
 
 
 class TestMultiFOVImport:
-    def test_imports_two_fovs(self, tmp_path):
-        r1 = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
-        r2 = np.random.randint(0, 65535, (64, 64), dtype=np.uint16)
+    def test_imports_two_fovs(self, tmp_path, experiment_store):
         tiff_dir = _make_tiff_dir(tmp_path, {
-            "region1_ch00.tif": r1,
-            "region2_ch00.tif": r2,
+            "region1_ch00.tif": ZEROS_64,
+            "region2_ch00.tif": ZEROS_64,
         })
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={},  # use defaults
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
+        plan = _plan(
+            tiff_dir,
+            pixel_size_um=0.65,
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
 
-            assert result.fovs_imported == 2
+        assert result.fovs_imported == 2
 
 
 class TestZProjectionImport:
-    def test_mip_projection(self, tmp_path):
-        z0 = np.ones((32, 32), dtype=np.uint16) * 10
-        z1 = np.ones((32, 32), dtype=np.uint16) * 50
-        z2 = np.ones((32, 32), dtype=np.uint16) * 30
+    def test_mip_projection(self, tmp_path, experiment_store):
+        """Engine wiring only; projection math is covered in test_transforms."""
+        z0 = np.full((32, 32), 50, dtype=np.uint16)
+        z1 = np.full((32, 32), 10, dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {
             "img_ch00_z00.tif": z0,
             "img_ch00_z01.tif": z1,
-            "img_ch00_z02.tif": z2,
         })
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"img": "FOV1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.images_written == 1
-            fov = store.get_fovs(condition="control")[0]
-            img = store.read_image_numpy(fov.id, "DAPI")
-            assert img[0, 0] == 50  # max of 10, 50, 30
+        plan = _plan(
+            tiff_dir,
+            fov_names={"img": "FOV1"},
+            pixel_size_um=0.65,
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.images_written == 1
+        fov = experiment_store.get_fovs(condition="control")[0]
+        img = experiment_store.read_image_numpy(fov.id, "DAPI")
+        assert img[0, 0] == 50  # max, not the last slice read
 
 
 class TestChannelMapping:
-    def test_renames_channels(self, tmp_path):
+    def test_renames_channels(self, tmp_path, experiment_store):
         data = np.zeros((32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {"img_ch00.tif": data})
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[
-                    ChannelMapping(token_value="00", name="DAPI", color="#0000FF"),
-                ],
-                fov_names={},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=None,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            engine.execute(plan, store)
-
-            channels = store.get_channels()
-            assert len(channels) == 1
-            assert channels[0].name == "DAPI"
+        plan = _plan(
+            tiff_dir,
+            channel_mappings=[
+                ChannelMapping(token_value="00", name="DAPI", color="#0000FF"),
+            ],
+        )
+        engine = ImportEngine()
+        engine.execute(plan, experiment_store)
+
+        channels = experiment_store.get_channels()
+        assert len(channels) == 1
+        assert channels[0].name == "DAPI"
 
 
 class TestFOVRenaming:
-    def test_renames_fovs(self, tmp_path):
+    def test_renames_fovs(self, tmp_path, experiment_store):
         data = np.zeros((32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {"myregion_ch00.tif": data})
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"myregion": "Well_A1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=None,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            engine.execute(plan, store)
+        plan = _plan(
+            tiff_dir,
+            fov_names={"myregion": "Well_A1"},
+        )
+        engine = ImportEngine()
+        engine.execute(plan, experiment_store)
 
-            fovs = store.get_fovs(condition="control")
-            assert len(fovs) == 1
-            assert fovs[0].display_name == "control_N1_Well_A1"
+        fovs = experiment_store.get_fovs(condition="control")
+        assert len(fovs) == 1
+        assert fovs[0].display_name == "control_N1_Well_A1"
 
 
 class TestIncrementalImport:
-    def test_skip_existing_fov(self, tmp_path):
+    def test_skip_existing_fov(self, tmp_path, experiment_store):
         data = np.zeros((32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {"img_ch00.tif": data})
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"img": "FOV1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-
-            # First import
-            r1 = engine.execute(plan, store)
-            assert r1.fovs_imported == 1
-            assert r1.skipped == 0
-
-            # Second import — FOV already exists
-            r2 = engine.execute(plan, store)
-            assert r2.fovs_imported == 0
-            assert r2.skipped == 1
-            assert any("already exists" in w for w in r2.warnings)
+        plan = _plan(
+            tiff_dir,
+            fov_names={"img": "FOV1"},
+            pixel_size_um=0.65,
+        )
+        engine = ImportEngine()
+
+        # First import
+        r1 = engine.execute(plan, experiment_store)
+        assert r1.fovs_imported == 1
+        assert r1.skipped == 0
+
+        # Second import — FOV already exists
+        r2 = engine.execute(plan, experiment_store)
+        assert r2.fovs_imported == 0
+        assert r2.skipped == 1
+        assert any("already exists" in w for w in r2.warnings)
 
 
 class TestProgressCallback:
-    def test_callback_called(self, tmp_path):
+    def test_callback_called(self, tmp_path, experiment_store):
         data = np.zeros((32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {"img_ch00.tif": data})
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"img": "FOV1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=None,
-                token_config=TokenConfig(),
-            )
-            calls = []
-            engine = ImportEngine()
-            engine.execute(plan, store, progress_callback=lambda c, t, n: calls.append((c, t, n)))
+        plan = _plan(
+            tiff_dir,
+            fov_names={"img": "FOV1"},
+        )
+        calls = []
+        engine = ImportEngine()
+        engine.execute(
+            plan, experiment_store,
+            progress_callback=lambda c, t, n: calls.append((c, t, n)),
+        )
 
-            assert len(calls) == 1
-            assert calls[0] == (1, 1, "control_N1_FOV1")
+        assert len(calls) == 1
+        assert calls[0] == (1, 1, "control_N1_FOV1")
 
 
 class TestMultiConditionImport:
-    def test_imports_two_conditions(self, tmp_path):
+    def test_imports_two_conditions(self, tmp_path, experiment_store):
         """Files from 2 conditions via condition_map are imported correctly."""
-        d1 = np.random.randint(0, 65535, (32, 32), dtype=np.uint16)
-        d2 = np.random.randint(0, 65535, (32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {
-            "ctrl_fov1_ch00.tif": d1,
-            "treated_fov1_ch00.tif": d2,
+            "ctrl_fov1_ch00.tif": _ZEROS_32,
+            "treated_fov1_ch00.tif": _ZEROS_32,
         })
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="default",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"ctrl_fov1": "fov1", "treated_fov1": "fov1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-                condition_map={
-                    "ctrl_fov1": "ctrl",
-                    "treated_fov1": "treated",
-                },
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.fovs_imported == 2
-            assert result.channels_registered == 1
-
-            conds = store.get_conditions()
-            assert "ctrl" in conds
-            assert "treated" in conds
-
-            fovs_ctrl = store.get_fovs(condition="ctrl")
-            fovs_treated = store.get_fovs(condition="treated")
-            assert len(fovs_ctrl) == 1
-            assert len(fovs_treated) == 1
-            assert fovs_ctrl[0].display_name == "ctrl_N1_fov1"
-            assert fovs_treated[0].display_name == "treated_N1_fov1"
-
-    def test_condition_map_empty_uses_fallback(self, tmp_path):
+        plan = _plan(
+            tiff_dir,
+            condition="default",
+            fov_names={"ctrl_fov1": "fov1", "treated_fov1": "fov1"},
+            pixel_size_um=0.65,
+            condition_map={
+                "ctrl_fov1": "ctrl",
+                "treated_fov1": "treated",
+            },
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.fovs_imported == 2
+        assert result.channels_registered == 1
+
+        conds = experiment_store.get_conditions()
+        assert "ctrl" in conds
+        assert "treated" in conds
+
+        fovs_ctrl = experiment_store.get_fovs(condition="ctrl")
+        fovs_treated = experiment_store.get_fovs(condition="treated")
+        assert len(fovs_ctrl) == 1
+        assert len(fovs_treated) == 1
+        assert fovs_ctrl[0].display_name == "ctrl_N1_fov1"
+        assert fovs_treated[0].display_name == "treated_N1_fov1"
+
+    def test_condition_map_empty_uses_fallback(self, tmp_path, experiment_store):
         """When condition_map is empty, single condition field is used."""
         data = np.zeros((32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {"img_ch00.tif": data})
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=None,
-                token_config=TokenConfig(),
-                condition_map={},
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.fovs_imported == 1
-            conds = store.get_conditions()
-            assert conds == ["control"]
-
-    def test_skip_existing_per_condition(self, tmp_path):
+        plan = _plan(
+            tiff_dir,
+            condition_map={},
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.fovs_imported == 1
+        conds = experiment_store.get_conditions()
+        assert conds == ["control"]
+
+    def test_skip_existing_per_condition(self, tmp_path, experiment_store):
         """Same FOV name in different conditions doesn't conflict."""
         d1 = np.zeros((32, 32), dtype=np.uint16)
         d2 = np.ones((32, 32), dtype=np.uint16) * 100
@@ -326,141 +293,104 @@ class TestMultiConditionImport:
             "treated_fov1_ch00.tif": d2,
         })
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="default",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"ctrl_fov1": "fov1", "treated_fov1": "fov1"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-                condition_map={
-                    "ctrl_fov1": "ctrl",
-                    "treated_fov1": "treated",
-                },
-            )
-            engine = ImportEngine()
-
-            # First import — both FOVs imported
-            r1 = engine.execute(plan, store)
-            assert r1.fovs_imported == 2
-            assert r1.skipped == 0
-
-            # Second import — both FOVs skipped
-            r2 = engine.execute(plan, store)
-            assert r2.fovs_imported == 0
-            assert r2.skipped == 2
+        plan = _plan(
+            tiff_dir,
+            condition="default",
+            fov_names={"ctrl_fov1": "fov1", "treated_fov1": "fov1"},
+            pixel_size_um=0.65,
+            condition_map={
+                "ctrl_fov1": "ctrl",
+                "treated_fov1": "treated",
+            },
+        )
+        engine = ImportEngine()
+
+        # First import — both FOVs imported
+        r1 = engine.execute(plan, experiment_store)
+        assert r1.fovs_imported == 2
+        assert r1.skipped == 0
+
+        # Second import — both FOVs skipped
+        r2 = engine.execute(plan, experiment_store)
+        assert r2.fovs_imported == 0
+        assert r2.skipped == 2
 
 
 class TestBioRepMap:
-    def test_per_group_bio_rep(self, tmp_path):
+    def test_per_group_bio_rep(self, tmp_path, experiment_store):
         """bio_rep_map assigns different bio reps per FOV token."""
-        d1 = np.random.randint(0, 65535, (32, 32), dtype=np.uint16)
-        d2 = np.random.randint(0, 65535, (32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {
-            "fov_a_ch00.tif": d1,
-            "fov_b_ch00.tif": d2,
+            "fov_a_ch00.tif": _ZEROS_32,
+            "fov_b_ch00.tif": _ZEROS_32,
         })
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="default",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"fov_a": "FOV_001", "fov_b": "FOV_001"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-                condition_map={"fov_a": "ctrl", "fov_b": "treated"},
-                bio_rep_map={"fov_a": "N1", "fov_b": "N2"},
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.fovs_imported == 2
-            fovs_ctrl = store.get_fovs(condition="ctrl", bio_rep="N1")
-            fovs_treated = store.get_fovs(condition="treated", bio_rep="N2")
-            assert len(fovs_ctrl) == 1
-            assert len(fovs_treated) == 1
-
-    def test_skips_unassigned_groups(self, tmp_path):
+        plan = _plan(
+            tiff_dir,
+            condition="default",
+            fov_names={"fov_a": "FOV_001", "fov_b": "FOV_001"},
+            pixel_size_um=0.65,
+            condition_map={"fov_a": "ctrl", "fov_b": "treated"},
+            bio_rep_map={"fov_a": "N1", "fov_b": "N2"},
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.fovs_imported == 2
+        fovs_ctrl = experiment_store.get_fovs(condition="ctrl", bio_rep="N1")
+        fovs_treated = experiment_store.get_fovs(condition="treated", bio_rep="N2")
+        assert len(fovs_ctrl) == 1
+        assert len(fovs_treated) == 1
+
+    def test_skips_unassigned_groups(self, tmp_path, experiment_store):
         """Groups not in condition_map are skipped when condition_map is non-empty."""
-        d1 = np.random.randint(0, 65535, (32, 32), dtype=np.uint16)
-        d2 = np.random.randint(0, 65535, (32, 32), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {
-            "assigned_ch00.tif": d1,
-            "skipped_ch00.tif": d2,
+            "assigned_ch00.tif": _ZEROS_32,
+            "skipped_ch00.tif": _ZEROS_32,
         })
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="default",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"assigned": "FOV_001"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.65,
-                token_config=TokenConfig(),
-                condition_map={"assigned": "ctrl"},
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
+        plan = _plan(
+            tiff_dir,
+            condition="default",
+            fov_names={"assigned": "FOV_001"},
+            pixel_size_um=0.65,
+            condition_map={"assigned": "ctrl"},
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
 
-            assert result.fovs_imported == 1
-            assert result.skipped == 1
+        assert result.fovs_imported == 1
+        assert result.skipped == 1
 
 
 class TestEdgeCases:
-    def test_invalid_source_path(self, tmp_path):
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=Path("/nonexistent"),
-                condition="control",
-                channel_mappings=[],
-                fov_names={},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=None,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            with pytest.raises(FileNotFoundError):
-                engine.execute(plan, store)
-
-    def test_empty_directory(self, tmp_path):
+    def test_invalid_source_path(self, experiment_store):
+        plan = _plan(
+            Path("/nonexistent"),
+            channel_mappings=[],
+        )
+        engine = ImportEngine()
+        with pytest.raises(FileNotFoundError):
+            engine.execute(plan, experiment_store)
+
+    def test_empty_directory(self, tmp_path, experiment_store):
         d = tmp_path / "empty"
         d.mkdir()
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=d,
-                condition="control",
-                channel_mappings=[],
-                fov_names={},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=None,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            with pytest.raises(ValueError, match="No TIFF"):
-                engine.execute(plan, store)
-
-    def test_elapsed_seconds_populated(self, tmp_path):
+        plan = _plan(
+            d,
+            channel_mappings=[],
+        )
+        engine = ImportEngine()
+        with pytest.raises(ValueError, match="No TIFF"):
+            engine.execute(plan, experiment_store)
+
+    def test_elapsed_seconds_populated(self, tmp_path, experiment_store):
         data = np.zeros((16, 16), dtype=np.uint16)
         tiff_dir = _make_tiff_dir(tmp_path, {"img_ch00.tif": data})
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=tiff_dir,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=None,
-                token_config=TokenConfig(),
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-            assert result.elapsed_seconds >= 0
+        plan = _plan(tiff_dir)
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+        assert result.elapsed_seconds >= 0
 
 
 # ---------------------------------------------------------------------------
@@ -609,7 +539,7 @@ class TestStitchTiles:
 
 
 class TestTileStitchImport:
-    def test_2x2_tile_stitch_import(self, tmp_path):
+    def test_2x2_tile_stitch_import(self, tmp_path, experiment_store):
         """Import 2x2 tiles for 1 channel → single stitched FOV."""
         d = tmp_path / "tiffs"
         d.mkdir()
@@ -624,36 +554,31 @@ class TestTileStitchImport:
             grid_type="row_by_row", order="right_and_down",
         )
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=d,
-                condition="control",
-                channel_mappings=[ChannelMapping(token_value="00", name="DAPI")],
-                fov_names={"FOV1": "FOV_001"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.5,
-                token_config=TokenConfig(),
-                tile_config=tile_config,
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.fovs_imported == 1
-            assert result.images_written == 1
-
-            fov = store.get_fovs(condition="control")[0]
-            assert fov.width == 64
-            assert fov.height == 64
-
-            img = store.read_image_numpy(fov.id, "DAPI")
-            assert img.shape == (64, 64)
-            # Verify tile placement
-            assert img[0, 0] == 50    # tile s00 at (0,0)
-            assert img[0, 32] == 100  # tile s01 at (0,1)
-            assert img[32, 0] == 150  # tile s02 at (1,0)
-            assert img[32, 32] == 200 # tile s03 at (1,1)
-
-    def test_multichannel_tile_stitch(self, tmp_path):
+        plan = _plan(
+            d,
+            fov_names={"FOV1": "FOV_001"},
+            pixel_size_um=0.5,
+            tile_config=tile_config,
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.fovs_imported == 1
+        assert result.images_written == 1
+
+        fov = experiment_store.get_fovs(condition="control")[0]
+        assert fov.width == 64
+        assert fov.height == 64
+
+        img = experiment_store.read_image_numpy(fov.id, "DAPI")
+        assert img.shape == (64, 64)
+        # Verify tile placement
+        assert img[0, 0] == 50    # tile s00 at (0,0)
+        assert img[0, 32] == 100  # tile s01 at (0,1)
+        assert img[32, 0] == 150  # tile s02 at (1,0)
+        assert img[32, 32] == 200 # tile s03 at (1,1)
+
+    def test_multichannel_tile_stitch(self, tmp_path, experiment_store):
         """Each channel is stitched independently with the same grid layout."""
         d = tmp_path / "tiffs"
         d.mkdir()
@@ -668,32 +593,28 @@ class TestTileStitchImport:
             grid_type="row_by_row", order="right_and_down",
         )
 
-        with ExperimentStore.create(tmp_path / "test.percell") as store:
-            plan = ImportPlan(
-                source_path=d,
-                condition="control",
-                channel_mappings=[
-                    ChannelMapping(token_value="00", name="DAPI"),
-                    ChannelMapping(token_value="01", name="GFP"),
-                ],
-                fov_names={"FOV1": "FOV_001"},
-                z_transform=ZTransform(method="mip"),
-                pixel_size_um=0.5,
-                token_config=TokenConfig(),
-                tile_config=tile_config,
-            )
-            engine = ImportEngine()
-            result = engine.execute(plan, store)
-
-            assert result.fovs_imported == 1
-            assert result.images_written == 2
-
-            fov = store.get_fovs(condition="control")[0]
-            dapi = store.read_image_numpy(fov.id, "DAPI")
-            gfp = store.read_image_numpy(fov.id, "GFP")
-            # ch0: s00=110, s01=120, s02=130, s03=140
-            assert dapi[0, 0] == 110
-            assert dapi[0, 16] == 120
-            # ch1: s00=210, s01=220, s02=230, s03=240
-            assert gfp[0, 0] == 210
-            assert gfp[0, 16] == 220
+        plan = _plan(
+            d,
+            channel_mappings=[
+                ChannelMapping(token_value="00", name="DAPI"),
+                ChannelMapping(token_value="01", name="GFP"),
+            ],
+            fov_names={"FOV1": "FOV_001"},
+            pixel_size_um=0.5,
+            tile_config=tile_config,
+        )
+        engine = ImportEngine()
+        result = engine.execute(plan, experiment_store)
+
+        assert result.fovs_imported == 1
+        assert result.images_written == 2
+
+        fov = experiment_store.get_fovs(condition="control")[0]
+        dapi = experiment_store.read_image_numpy(fov.id, "DAPI")
+        gfp = experiment_store.read_image_numpy(fov.id, "GFP")
+        # ch0: s00=110, s01=120, s02=130, s03=140
+        assert dapi[0, 0] == 110
+        assert dapi[0, 16] == 120
+        # ch1: s00=210, s01=220, s02=230, s03=240
+        assert gfp[0, 0] == 210
+        assert gfp[0, 16] == 220
@@ -42,6 +42,15 @@ class TestTokenConfig:
         assert tc.channel == r"_C(\d+)"
         assert tc.fov == r"_r(\d+)"
 
+    def test_compiled_patterns(self):
+        tc = TokenConfig(series=None)
+        assert tc.compiled("channel").pattern == tc.channel
+        assert tc.compiled("series") is None
+        assert tc.compiled("fov") is None
+        # Compiled cache is not part of equality or the repr
+        assert tc == TokenConfig(series=None)
+        assert "_compiled" not in repr(tc)
+
     def test_frozen(self):
         tc = TokenConfig()
         import pytest
@@ -93,6 +93,35 @@ class TestScanEdgeCases:
         result = scanner.scan(d)
         assert not any("Inconsistent shapes" in w for w in result.warnings)
 
+    def test_unreadable_file_warns_and_keeps_others(self, tmp_path):
+        d = tmp_path / "partly_corrupt"
+        d.mkdir()
+        for name in ("a_ch00.tif", "c_ch00.tif", "d_ch00.tif"):
+            tifffile.imwrite(str(d / name), np.zeros((32, 32), dtype=np.uint16))
+        (d / "b_ch00.tif").write_bytes(b"not a tiff")
+
+        result = FileScanner().scan(d)
+        assert [f.path.name for f in result.files] == [
+            "a_ch00.tif", "c_ch00.tif", "d_ch00.tif",
+        ]
+        assert len(result.warnings) == 1
+        assert "b_ch00.tif" in result.warnings[0]
+
+    def test_walks_subdirectories(self, tmp_path):
+        """Nested TIFFs are found, extensions match case-insensitively."""
+        d = tmp_path / "nested"
+        (d / "a" / "b").mkdir(parents=True)
+        data = np.zeros((32, 32), dtype=np.uint16)
+        tifffile.imwrite(str(d / "top_ch00.tif"), data)
+        tifffile.imwrite(str(d / "a" / "mid_ch00.TIF"), data)
+        tifffile.imwrite(str(d / "a" / "b" / "deep_ch00.tiff"), data)
+        (d / "a" / "notes.txt").write_text("not a tiff")
+
+        result = FileScanner().scan(d)
+        assert sorted(f.path.name for f in result.files) == [
+            "deep_ch00.tiff", "mid_ch00.TIF", "top_ch00.tif",
+        ]
+
 
 class TestSymlinkGuard:
     def test_symlinked_tiff_file_skipped(self, tmp_path):
@@ -158,6 +158,14 @@ class TestErrorHandling:
         with pytest.raises(Exception):
             ImportPlan.from_yaml(yaml_path)
 
+    def test_python_tags_rejected(self, tmp_path):
+        """Plans are loaded with a safe loader; arbitrary objects never build."""
+        yaml = pytest.importorskip("yaml")
+        yaml_path = tmp_path / "unsafe.yaml"
+        yaml_path.write_text("source_path: !!python/object/apply:os.getcwd []\n")
+        with pytest.raises(yaml.constructor.ConstructorError):
+            ImportPlan.from_yaml(yaml_path)
+
     def test_missing_required_key_raises(self, tmp_path):
         yaml_path = tmp_path / "incomplete.yaml"
         yaml_path.write_text("source_path: /some/path\n")
@@ -37,6 +37,16 @@ class TestReadTiff:
         result = read_tiff(p)
         assert result.dtype == np.float32
 
+    def test_result_is_writable(self, tmp_path):
+        """Z-projection accumulates into the returned array in place."""
+        p = tmp_path / "writable.tif"
+        tifffile.imwrite(str(p), np.zeros((8, 8), dtype=np.uint16))
+
+        result = read_tiff(p)
+        assert result.flags.writeable
+        result[0, 0] = 1
+        assert read_tiff(p)[0, 0] == 0
+
 
 class TestXXEProtection:
     def test_entity_expansion_rejected(self, tmp_path):
@@ -99,3 +109,26 @@ class TestReadTiffMetadata:
         meta = read_tiff_metadata(p)
         if meta["pixel_size_um"] is not None:
             assert meta["pixel_size_um"] == 1000.0
+
+    def test_ome_pixel_size_extracted(self, tmp_path):
+        p = tmp_path / "img.ome.tif"
+        tifffile.imwrite(
+            str(p), np.zeros((32, 32), dtype=np.uint16), ome=True,
+            metadata={"PhysicalSizeX": 0.325, "PhysicalSizeXUnit": "µm"},
+        )
+
+        assert read_tiff_metadata(p)["pixel_size_um"] == 0.325
+
+    def test_ome_other_schema_version(self, tmp_path):
+        """Pixels outside the 2016-06 namespace are found by the wildcard."""
+        xml = (
+            '<OME xmlns="http://www.openmicroscopy.org/Schemas/OME/2015-01">'
+            '<Image ID="Image:0"><Pixels PhysicalSizeX="650" '
+            'PhysicalSizeXUnit="nm" /></Image></OME>'
+        )
+        p = tmp_path / "old_schema.tif"
+        tifffile.imwrite(str(p), np.zeros((32, 32), dtype=np.uint16))
+
+        with patch.object(tifffile.TiffFile, "ome_metadata", new=property(lambda self: xml)):
+            meta = read_tiff_metadata(p)
+        assert meta["pixel_size_um"] == pytest.approx(0.65)